@@ -5,6 +5,7 @@ import numpy as np
 import pandas as pd
 import scipy.linalg
 import scipy.interpolate
+import scipy.sparse
 import typing
 
 import cobmo.config
@@ -75,6 +76,7 @@ class BuildingModel(object):
         electricity_price_timeseries (pd.DataFrame): Electricity price timeseries.
         output_minimum_timeseries (pd.DataFrame): Minimum output constraint timeseries.
         output_maximum_timeseries (pd.DataFrame): Maximum output constraint timeseries.
+        sparse_matrix_cache (dict): Cache of Scipy sparse CSR matrices, as obtained via `get_sparse_matrix()`.
     """
 
     scenario_name: str
@@ -95,6 +97,7 @@ class BuildingModel(object):
     electricity_price_timeseries: pd.DataFrame
     output_minimum_timeseries: pd.DataFrame
     output_maximum_timeseries: pd.DataFrame
+    sparse_matrix_cache: dict
 
     def __init__(
             self,
@@ -124,6 +127,20 @@ class BuildingModel(object):
         # Store building data.
         self.building_data = building_data
 
+        # Obtain parameter shorthands.
+        # - These parameters are used in the zone / surface loops below and are obtained once to avoid repeated lookups.
+        heat_transfer_coefficient_interior_convection = (
+            building_data.parameters.at['heat_transfer_coefficient_interior_convection']
+        )
+        heat_transfer_coefficient_exterior_convection = (
+            building_data.parameters.at['heat_transfer_coefficient_exterior_convection']
+        )
+        stefan_boltzmann_constant = building_data.parameters.at['stefan_boltzmann_constant']
+        density_air = building_data.parameters.at['density_air']
+        heat_capacity_air = building_data.parameters.at['heat_capacity_air']
+        water_density = building_data.parameters.at['water_density']
+        water_specific_heat = building_data.parameters.at['water_specific_heat']
+
         # Obtain total building zone area.
         # - This is used for scaling air flow / power values to per-square-meter values.
         self.zone_area_total = building_data.zones['zone_area'].sum()
@@ -493,7 +510,7 @@ class BuildingModel(object):
             # Calculate zone air mass (equivalent to moisture capacity).
             building_data.zones['zone_air_mass'] = (
                 building_data.zones['zone_volume']
-                * building_data.parameters.at['density_air']
+                * density_air
             )
 
             # Instantiate columns for parameters / heat transfer coefficients.
@@ -580,7 +597,7 @@ class BuildingModel(object):
                     'heat_transfer_coefficient_surface_sky'
                 ] = (
                     4.0
-                    * building_data.parameters.at['stefan_boltzmann_constant']
+                    * stefan_boltzmann_constant
                     * surface_data.at['emissivity_surface']
                     * surface_data.at['sky_view_factor']
                     * (
@@ -596,7 +613,7 @@ class BuildingModel(object):
                     'heat_transfer_coefficient_surface_ground'
                 ] = (
                     4.0
-                    * building_data.parameters.at['stefan_boltzmann_constant']
+                    * stefan_boltzmann_constant
                     * surface_data.at['emissivity_surface']
                     * (1.0 - surface_data.at['sky_view_factor'])
                     * (
@@ -613,7 +630,7 @@ class BuildingModel(object):
                         'heat_transfer_coefficient_window_sky'
                     ] = (
                         4.0
-                        * building_data.parameters.at['stefan_boltzmann_constant']
+                        * stefan_boltzmann_constant
                         * surface_data.at['emissivity_window']
                         * surface_data.at['sky_view_factor']
                         * (
@@ -629,7 +646,7 @@ class BuildingModel(object):
                         'heat_transfer_coefficient_window_ground'
                     ] = (
                         4.0
-                        * building_data.parameters.at['stefan_boltzmann_constant']
+                        * stefan_boltzmann_constant
                         * surface_data.at['emissivity_window']
                         * (1.0 - surface_data.at['sky_view_factor'])
                         * (
@@ -661,163 +678,166 @@ class BuildingModel(object):
                     building_data.zones['thermal_resistance_radiator_panel_2_front_zone'] = None
 
                 # Calculate heat transfer coefficients.
-                for zone_name, zone_data in building_data.zones.iterrows():
-                    if pd.notnull(zone_data.at['hvac_radiator_type']):
-                        # Calculate geometric parameters and heat capacity.
-                        thickness_water_layer = (
-                            zone_data.at['radiator_water_volume']
-                            / zone_data.at['radiator_panel_area']
-                        )
-                        thickness_hull_layer = (
-                            # Thickness for hull on one side of the panel.
-                            0.5 * (
-                                zone_data.at['radiator_panel_thickness']
-                                - thickness_water_layer
-                            )
-                        )
-                        radiator_hull_volume = (
-                            # Volume for hull on one side of the panel.
-                            thickness_hull_layer
-                            * zone_data.at['radiator_panel_area']
-                        )
-                        building_data.zones.at[zone_name, 'heat_capacitance_hull'] = (
-                            radiator_hull_volume
-                            * zone_data.at['radiator_hull_heat_capacity']
-                        )
-                        building_data.zones.at[zone_name, 'heat_capacitance_water'] = (
-                            zone_data.at['radiator_water_volume']
-                            * building_data.parameters.at['water_specific_heat']
+                for zone_name, zone_data in (
+                        building_data.zones[
+                            pd.notnull(building_data.zones['hvac_radiator_type'])
+                        ].iterrows()
+                ):
+                    # Calculate geometric parameters and heat capacity.
+                    thickness_water_layer = (
+                        zone_data.at['radiator_water_volume']
+                        / zone_data.at['radiator_panel_area']
+                    )
+                    thickness_hull_layer = (
+                        # Thickness for hull on one side of the panel.
+                        0.5 * (
+                            zone_data.at['radiator_panel_thickness']
+                            - thickness_water_layer
                         )
+                    )
+                    radiator_hull_volume = (
+                        # Volume for hull on one side of the panel.
+                        thickness_hull_layer
+                        * zone_data.at['radiator_panel_area']
+                    )
+                    building_data.zones.at[zone_name, 'heat_capacitance_hull'] = (
+                        radiator_hull_volume
+                        * zone_data.at['radiator_hull_heat_capacity']
+                    )
+                    building_data.zones.at[zone_name, 'heat_capacitance_water'] = (
+                        zone_data.at['radiator_water_volume']
+                        * water_specific_heat
+                    )
 
-                        # Calculate fundamental thermal resistances.
-                        thermal_resistance_conduction = (
-                            thickness_hull_layer
-                            / (
-                                zone_data.at['radiator_hull_conductivity']
-                                * zone_data.at['radiator_panel_area']
-                            )
+                    # Calculate fundamental thermal resistances.
+                    thermal_resistance_conduction = (
+                        thickness_hull_layer
+                        / (
+                            zone_data.at['radiator_hull_conductivity']
+                            * zone_data.at['radiator_panel_area']
                         )
-                        thermal_resistance_convection = (
-                            1.0
-                            / (
-                                zone_data.at['radiator_convection_coefficient']
-                                * zone_data.at['radiator_panel_area']
-                            )
+                    )
+                    thermal_resistance_convection = (
+                        1.0
+                        / (
+                            zone_data.at['radiator_convection_coefficient']
+                            * zone_data.at['radiator_panel_area']
                         )
-                        temperature_radiator_surfaces_mean = (
+                    )
+                    temperature_radiator_surfaces_mean = (
+                        0.5
+                        * (
                             0.5
                             * (
-                                0.5
-                                * (
-                                    zone_data.at['radiator_supply_temperature_nominal']
-                                    + zone_data.at['radiator_return_temperature_nominal']
-                                )
-                                + building_data.scenarios.at['linearization_surface_temperature']
+                                zone_data.at['radiator_supply_temperature_nominal']
+                                + zone_data.at['radiator_return_temperature_nominal']
                             )
+                            + building_data.scenarios.at['linearization_surface_temperature']
                         )
-                        thermal_resistance_radiation_front = (
-                            (
-                                (1.0 / zone_data.at['radiator_panel_area'])
-                                + (
-                                    (1.0 - zone_data.at['radiator_emissivity'])
-                                    / (
-                                        zone_data.at['radiator_panel_area']
-                                        * zone_data.at['radiator_emissivity']
-                                    )
-                                )
-                                + (
-                                    # TODO: Use total zone surface area and emissivity?
-                                    (1.0 - zone_data.at['zone_surfaces_wall_emissivity'])
-                                    / (
-                                        zone_data.at['zone_surfaces_wall_area']
-                                        * zone_data.at['zone_surfaces_wall_emissivity']
-                                    )
+                    )
+                    thermal_resistance_radiation_front = (
+                        (
+                            (1.0 / zone_data.at['radiator_panel_area'])
+                            + (
+                                (1.0 - zone_data.at['radiator_emissivity'])
+                                / (
+                                    zone_data.at['radiator_panel_area']
+                                    * zone_data.at['radiator_emissivity']
                                 )
                             )
-                            / (
-                                (
-                                    4.0 * building_data.parameters.at['stefan_boltzmann_constant']
-                                    * (temperature_radiator_surfaces_mean ** 3.0)
+                            + (
+                                # TODO: Use total zone surface area and emissivity?
+                                (1.0 - zone_data.at['zone_surfaces_wall_emissivity'])
+                                / (
+                                    zone_data.at['zone_surfaces_wall_area']
+                                    * zone_data.at['zone_surfaces_wall_emissivity']
                                 )
                             )
                         )
-                        thermal_resistance_radiation_rear = (
+                        / (
                             (
-                                (1.0 / zone_data.at['radiator_panel_area'])
-                                + (
-                                    (1.0 - zone_data.at['radiator_emissivity'])
-                                    / (
-                                        zone_data.at['radiator_panel_area']
-                                        * zone_data.at['radiator_emissivity']
-                                    )
-                                )
-                                + (
-                                    # TODO: Use total zone surface area and emissivity?
-                                    (1.0 - zone_data.at['zone_surfaces_wall_emissivity'])
-                                    / (
-                                        zone_data.at['radiator_panel_area']
-                                        * zone_data.at['zone_surfaces_wall_emissivity']
-                                    )
+                                4.0 * stefan_boltzmann_constant
+                                * (temperature_radiator_surfaces_mean ** 3.0)
+                            )
+                        )
+                    )
+                    thermal_resistance_radiation_rear = (
+                        (
+                            (1.0 / zone_data.at['radiator_panel_area'])
+                            + (
+                                (1.0 - zone_data.at['radiator_emissivity'])
+                                / (
+                                    zone_data.at['radiator_panel_area']
+                                    * zone_data.at['radiator_emissivity']
                                 )
                             )
-                            / (
-                                (
-                                    4.0 * building_data.parameters.at['stefan_boltzmann_constant']
-                                    * (temperature_radiator_surfaces_mean ** 3.0)
+                            + (
+                                # TODO: Use total zone surface area and emissivity?
+                                (1.0 - zone_data.at['zone_surfaces_wall_emissivity'])
+                                / (
+                                    zone_data.at['radiator_panel_area']
+                                    * zone_data.at['zone_surfaces_wall_emissivity']
                                 )
                             )
                         )
-                        thermal_resistance_star_sum_front = (
-                            0.5 * thermal_resistance_conduction * thermal_resistance_convection
-                            + 0.5 * thermal_resistance_conduction * thermal_resistance_radiation_front
-                            + thermal_resistance_convection * thermal_resistance_radiation_front
-                        )
-                        thermal_resistance_star_sum_rear = (
-                            0.5 * thermal_resistance_conduction * thermal_resistance_convection
-                            + 0.5 * thermal_resistance_conduction * thermal_resistance_radiation_rear
-                            + thermal_resistance_convection * thermal_resistance_radiation_rear
+                        / (
+                            (
+                                4.0 * stefan_boltzmann_constant
+                                * (temperature_radiator_surfaces_mean ** 3.0)
+                            )
                         )
+                    )
+                    thermal_resistance_star_sum_front = (
+                        0.5 * thermal_resistance_conduction * thermal_resistance_convection
+                        + 0.5 * thermal_resistance_conduction * thermal_resistance_radiation_front
+                        + thermal_resistance_convection * thermal_resistance_radiation_front
+                    )
+                    thermal_resistance_star_sum_rear = (
+                        0.5 * thermal_resistance_conduction * thermal_resistance_convection
+                        + 0.5 * thermal_resistance_conduction * thermal_resistance_radiation_rear
+                        + thermal_resistance_convection * thermal_resistance_radiation_rear
+                    )
 
-                        # Calculate transformed thermal resistances.
-                        building_data.zones.at[zone_name, 'thermal_resistance_radiator_hull_conduction'] = (
-                            thermal_resistance_conduction
-                        )
-                        building_data.zones.at[zone_name, 'thermal_resistance_radiator_front_zone'] = (
-                            thermal_resistance_star_sum_front / thermal_resistance_radiation_front
-                        )
-                        building_data.zones.at[zone_name, 'thermal_resistance_radiator_front_surfaces'] = (
-                            thermal_resistance_star_sum_front / thermal_resistance_convection
-                        )
-                        building_data.zones.at[zone_name, 'thermal_resistance_radiator_front_zone_surfaces'] = (
-                            thermal_resistance_star_sum_front / (0.5 * thermal_resistance_conduction)
-                        )
-                        building_data.zones.at[zone_name, 'thermal_resistance_radiator_rear_zone'] = (
-                            thermal_resistance_star_sum_rear / thermal_resistance_radiation_rear
-                        )
-                        building_data.zones.at[zone_name, 'thermal_resistance_radiator_rear_surfaces'] = (
-                            thermal_resistance_star_sum_rear / thermal_resistance_convection
-                        )
-                        building_data.zones.at[zone_name, 'thermal_resistance_radiator_rear_zone_surfaces'] = (
-                            thermal_resistance_star_sum_rear / (0.5 * thermal_resistance_conduction)
-                        )
+                    # Calculate transformed thermal resistances.
+                    building_data.zones.at[zone_name, 'thermal_resistance_radiator_hull_conduction'] = (
+                        thermal_resistance_conduction
+                    )
+                    building_data.zones.at[zone_name, 'thermal_resistance_radiator_front_zone'] = (
+                        thermal_resistance_star_sum_front / thermal_resistance_radiation_front
+                    )
+                    building_data.zones.at[zone_name, 'thermal_resistance_radiator_front_surfaces'] = (
+                        thermal_resistance_star_sum_front / thermal_resistance_convection
+                    )
+                    building_data.zones.at[zone_name, 'thermal_resistance_radiator_front_zone_surfaces'] = (
+                        thermal_resistance_star_sum_front / (0.5 * thermal_resistance_conduction)
+                    )
+                    building_data.zones.at[zone_name, 'thermal_resistance_radiator_rear_zone'] = (
+                        thermal_resistance_star_sum_rear / thermal_resistance_radiation_rear
+                    )
+                    building_data.zones.at[zone_name, 'thermal_resistance_radiator_rear_surfaces'] = (
+                        thermal_resistance_star_sum_rear / thermal_resistance_convection
+                    )
+                    building_data.zones.at[zone_name, 'thermal_resistance_radiator_rear_zone_surfaces'] = (
+                        thermal_resistance_star_sum_rear / (0.5 * thermal_resistance_conduction)
+                    )
 
-                        if (building_data.zones['radiator_panel_number'] == '2').any():
-                            thermal_resistance_convection_fin = (
-                                1.0
-                                / (
-                                    thermal_resistance_convection
-                                    * zone_data.at['radiator_fin_effectiveness']
-                                )
+                    if (building_data.zones['radiator_panel_number'] == '2').any():
+                        thermal_resistance_convection_fin = (
+                            1.0
+                            / (
+                                thermal_resistance_convection
+                                * zone_data.at['radiator_fin_effectiveness']
                             )
+                        )
 
-                            building_data.zones.at[zone_name, 'thermal_resistance_radiator_panel_1_rear_zone'] = (
-                                0.5 * thermal_resistance_conduction
-                                + thermal_resistance_convection
-                            )
-                            building_data.zones.at[zone_name, 'thermal_resistance_radiator_panel_2_front_zone'] = (
-                                0.5 * thermal_resistance_conduction
-                                + thermal_resistance_convection_fin
-                            )
+                        building_data.zones.at[zone_name, 'thermal_resistance_radiator_panel_1_rear_zone'] = (
+                            0.5 * thermal_resistance_conduction
+                            + thermal_resistance_convection
+                        )
+                        building_data.zones.at[zone_name, 'thermal_resistance_radiator_panel_2_front_zone'] = (
+                            0.5 * thermal_resistance_conduction
+                            + thermal_resistance_convection_fin
+                        )
 
         def define_heat_transfer_surfaces_exterior():
             """Thermal model: Exterior surfaces"""
@@ -836,7 +856,7 @@ class BuildingModel(object):
                         * (
                             1.0
                             + (
-                                building_data.parameters.at['heat_transfer_coefficient_exterior_convection']
+                                heat_transfer_coefficient_exterior_convection
                                 + surface_data.at['heat_transfer_coefficient_surface_ground']
                                 + surface_data.at['heat_transfer_coefficient_surface_sky']
                             )
@@ -852,7 +872,7 @@ class BuildingModel(object):
                         'ambient_air_temperature'
                     ] += (
                         (
-                            building_data.parameters.at['heat_transfer_coefficient_exterior_convection']
+                            heat_transfer_coefficient_exterior_convection
                             + surface_data.at['heat_transfer_coefficient_surface_ground']
                         )
                         * surface_data.at['surface_area']
@@ -860,7 +880,7 @@ class BuildingModel(object):
                         * (
                             1.0
                             + (
-                                building_data.parameters.at['heat_transfer_coefficient_exterior_convection']
+                                heat_transfer_coefficient_exterior_convection
                                 + surface_data.at['heat_transfer_coefficient_surface_ground']
                                 + surface_data.at['heat_transfer_coefficient_surface_sky']
                             )
@@ -881,7 +901,7 @@ class BuildingModel(object):
                         * (
                             1.0
                             + (
-                                building_data.parameters.at['heat_transfer_coefficient_exterior_convection']
+                                heat_transfer_coefficient_exterior_convection
                                 + surface_data.at['heat_transfer_coefficient_surface_ground']
                                 + surface_data.at['heat_transfer_coefficient_surface_sky']
                             )
@@ -902,7 +922,7 @@ class BuildingModel(object):
                         * (
                             1.0
                             / (
-                                building_data.parameters.at['heat_transfer_coefficient_exterior_convection']
+                                heat_transfer_coefficient_exterior_convection
                                 + surface_data.at['heat_transfer_coefficient_surface_ground']
                                 + surface_data.at['heat_transfer_coefficient_surface_sky']
                             )
@@ -937,7 +957,7 @@ class BuildingModel(object):
                             * (
                                 1.0
                                 + (
-                                    building_data.parameters.at['heat_transfer_coefficient_interior_convection']
+                                    heat_transfer_coefficient_interior_convection
                                 )
                                 / (
                                     2.0
@@ -956,7 +976,7 @@ class BuildingModel(object):
                         * (
                             1.0
                             / (
-                                building_data.parameters.at['heat_transfer_coefficient_interior_convection']
+                                heat_transfer_coefficient_interior_convection
                             )
                             + 1.0
                             / (
@@ -975,7 +995,7 @@ class BuildingModel(object):
                         * (
                             1.0
                             / (
-                                building_data.parameters.at['heat_transfer_coefficient_interior_convection']
+                                heat_transfer_coefficient_interior_convection
                             )
                             + 1.0
                             / (
@@ -1008,7 +1028,7 @@ class BuildingModel(object):
                             * (1.0 - (
                                 1.0
                                 + (
-                                    building_data.parameters.at['heat_transfer_coefficient_interior_convection']
+                                    heat_transfer_coefficient_interior_convection
                                 )
                                 / (
                                     2.0
@@ -1026,7 +1046,7 @@ class BuildingModel(object):
                         * (
                             1.0
                             / (
-                                building_data.parameters.at['heat_transfer_coefficient_interior_convection']
+                                heat_transfer_coefficient_interior_convection
                             )
                             + 1.0
                             / (
@@ -1046,7 +1066,7 @@ class BuildingModel(object):
                         * (
                             1.0
                             / (
-                                building_data.parameters.at['heat_transfer_coefficient_interior_convection']
+                                heat_transfer_coefficient_interior_convection
                             )
                             + 1.0
                             / (
@@ -1068,13 +1088,13 @@ class BuildingModel(object):
                         * (
                             1.0
                             + (
-                                building_data.parameters.at['heat_transfer_coefficient_exterior_convection']
+                                heat_transfer_coefficient_exterior_convection
                                 + surface_data.at['heat_transfer_coefficient_surface_ground']
                                 + surface_data.at['heat_transfer_coefficient_surface_sky']
                             )
-                            / building_data.parameters.at['heat_transfer_coefficient_interior_convection']
+                            / heat_transfer_coefficient_interior_convection
                             + (
-                                building_data.parameters.at['heat_transfer_coefficient_exterior_convection']
+                                heat_transfer_coefficient_exterior_convection
                                 + surface_data.at['heat_transfer_coefficient_surface_ground']
                                 + surface_data.at['heat_transfer_coefficient_surface_sky']
                             )
@@ -1087,7 +1107,7 @@ class BuildingModel(object):
                         'ambient_air_temperature'
                     ] += (
                         (
-                            building_data.parameters.at['heat_transfer_coefficient_exterior_convection']
+                            heat_transfer_coefficient_exterior_convection
                             + surface_data.at['heat_transfer_coefficient_surface_ground']
                         )
                         * surface_data.at['surface_area']
@@ -1095,13 +1115,13 @@ class BuildingModel(object):
                         * (
                             1.0
                             + (
-                                building_data.parameters.at['heat_transfer_coefficient_exterior_convection']
+                                heat_transfer_coefficient_exterior_convection
                                 + surface_data.at['heat_transfer_coefficient_surface_ground']
                                 + surface_data.at['heat_transfer_coefficient_surface_sky']
                             )
-                            / building_data.parameters.at['heat_transfer_coefficient_interior_convection']
+                            / heat_transfer_coefficient_interior_convection
                             + (
-                                building_data.parameters.at['heat_transfer_coefficient_exterior_convection']
+                                heat_transfer_coefficient_exterior_convection
                                 + surface_data.at['heat_transfer_coefficient_surface_ground']
                                 + surface_data.at['heat_transfer_coefficient_surface_sky']
                             )
@@ -1119,13 +1139,13 @@ class BuildingModel(object):
                         * (
                             1.0
                             + (
-                                building_data.parameters.at['heat_transfer_coefficient_exterior_convection']
+                                heat_transfer_coefficient_exterior_convection
                                 + surface_data.at['heat_transfer_coefficient_surface_ground']
                                 + surface_data.at['heat_transfer_coefficient_surface_sky']
                             )
-                            / building_data.parameters.at['heat_transfer_coefficient_interior_convection']
+                            / heat_transfer_coefficient_interior_convection
                             + (
-                                building_data.parameters.at['heat_transfer_coefficient_exterior_convection']
+                                heat_transfer_coefficient_exterior_convection
                                 + surface_data.at['heat_transfer_coefficient_surface_ground']
                                 + surface_data.at['heat_transfer_coefficient_surface_sky']
                             )
@@ -1143,12 +1163,12 @@ class BuildingModel(object):
                         * (
                             1.0
                             / (
-                                building_data.parameters.at['heat_transfer_coefficient_exterior_convection']
+                                heat_transfer_coefficient_exterior_convection
                                 + surface_data.at['heat_transfer_coefficient_surface_ground']
                                 + surface_data.at['heat_transfer_coefficient_surface_sky']
                             )
                             + 1.0
-                            / building_data.parameters.at['heat_transfer_coefficient_interior_convection']
+                            / heat_transfer_coefficient_interior_convection
                             + 1.0
                             / (surface_data.at['heat_transfer_coefficient_conduction_surface'])
                         ) ** (- 1)
@@ -1175,13 +1195,13 @@ class BuildingModel(object):
                             * (1.0 - (
                                 1.0
                                 + (
-                                    building_data.parameters.at['heat_transfer_coefficient_exterior_convection']
+                                    heat_transfer_coefficient_exterior_convection
                                     + surface_data.at['heat_transfer_coefficient_surface_ground']
                                     + surface_data.at['heat_transfer_coefficient_surface_sky']
                                 )
-                                / building_data.parameters.at['heat_transfer_coefficient_interior_convection']
+                                / heat_transfer_coefficient_interior_convection
                                 + (
-                                    building_data.parameters.at['heat_transfer_coefficient_exterior_convection']
+                                    heat_transfer_coefficient_exterior_convection
                                     + surface_data.at['heat_transfer_coefficient_surface_ground']
                                     + surface_data.at['heat_transfer_coefficient_surface_sky']
                                 )
@@ -1203,13 +1223,13 @@ class BuildingModel(object):
                         * (
                             1.0
                             + (
-                                building_data.parameters.at['heat_transfer_coefficient_exterior_convection']
+                                heat_transfer_coefficient_exterior_convection
                                 + surface_data.at['heat_transfer_coefficient_window_ground']
                                 + surface_data.at['heat_transfer_coefficient_window_sky']
                             )
-                            / building_data.parameters.at['heat_transfer_coefficient_interior_convection']
+                            / heat_transfer_coefficient_interior_convection
                             + (
-                                building_data.parameters.at['heat_transfer_coefficient_exterior_convection']
+                                heat_transfer_coefficient_exterior_convection
                                 + surface_data.at['heat_transfer_coefficient_window_ground']
                                 + surface_data.at['heat_transfer_coefficient_window_sky']
                             )
@@ -1222,7 +1242,7 @@ class BuildingModel(object):
                         'ambient_air_temperature'
                     ] += (
                         (
-                            building_data.parameters.at['heat_transfer_coefficient_exterior_convection']
+                            heat_transfer_coefficient_exterior_convection
                             + surface_data.at['heat_transfer_coefficient_window_ground']
                         )
                         * surface_data.at['surface_area']
@@ -1230,13 +1250,13 @@ class BuildingModel(object):
                         * (
                             1.0
                             + (
-                                building_data.parameters.at['heat_transfer_coefficient_exterior_convection']
+                                heat_transfer_coefficient_exterior_convection
                                 + surface_data.at['heat_transfer_coefficient_window_ground']
                                 + surface_data.at['heat_transfer_coefficient_window_sky']
                             )
-                            / building_data.parameters.at['heat_transfer_coefficient_interior_convection']
+                            / heat_transfer_coefficient_interior_convection
                             + (
-                                building_data.parameters.at['heat_transfer_coefficient_exterior_convection']
+                                heat_transfer_coefficient_exterior_convection
                                 + surface_data.at['heat_transfer_coefficient_window_ground']
                                 + surface_data.at['heat_transfer_coefficient_window_sky']
                             )
@@ -1254,13 +1274,13 @@ class BuildingModel(object):
                         * (
                             1.0
                             + (
-                                building_data.parameters.at['heat_transfer_coefficient_exterior_convection']
+                                heat_transfer_coefficient_exterior_convection
                                 + surface_data.at['heat_transfer_coefficient_window_ground']
                                 + surface_data.at['heat_transfer_coefficient_window_sky']
                             )
-                            / building_data.parameters.at['heat_transfer_coefficient_interior_convection']
+                            / heat_transfer_coefficient_interior_convection
                             + (
-                                building_data.parameters.at['heat_transfer_coefficient_exterior_convection']
+                                heat_transfer_coefficient_exterior_convection
                                 + surface_data.at['heat_transfer_coefficient_window_ground']
                                 + surface_data.at['heat_transfer_coefficient_window_sky']
                             )
@@ -1278,12 +1298,12 @@ class BuildingModel(object):
                         * (
                             1.0
                             / (
-                                building_data.parameters.at['heat_transfer_coefficient_exterior_convection']
+                                heat_transfer_coefficient_exterior_convection
                                 + surface_data.at['heat_transfer_coefficient_window_ground']
                                 + surface_data.at['heat_transfer_coefficient_window_sky']
                             )
                             + 1.0
-                            / building_data.parameters.at['heat_transfer_coefficient_interior_convection']
+                            / heat_transfer_coefficient_interior_convection
                             + 1.0
                             / surface_data.at['heat_transfer_coefficient_conduction_window']
                         ) ** (- 1)
@@ -1310,13 +1330,13 @@ class BuildingModel(object):
                             * (1.0 - (
                                 1.0
                                 + (
-                                    building_data.parameters.at['heat_transfer_coefficient_exterior_convection']
+                                    heat_transfer_coefficient_exterior_convection
                                     + surface_data.at['heat_transfer_coefficient_window_ground']
                                     + surface_data.at['heat_transfer_coefficient_window_sky']
                                 )
-                                / building_data.parameters.at['heat_transfer_coefficient_interior_convection']
+                                / heat_transfer_coefficient_interior_convection
                                 + (
-                                    building_data.parameters.at['heat_transfer_coefficient_exterior_convection']
+                                    heat_transfer_coefficient_exterior_convection
                                     + surface_data.at['heat_transfer_coefficient_window_ground']
                                     + surface_data.at['heat_transfer_coefficient_window_sky']
                                 )
@@ -1352,7 +1372,7 @@ class BuildingModel(object):
                                 * (1 - surface_data.at['window_wall_ratio'])
                                 * (
                                     1.0
-                                    + building_data.parameters.at['heat_transfer_coefficient_interior_convection']
+                                    + heat_transfer_coefficient_interior_convection
                                     / (
                                         2.0
                                         * surface_data.at['heat_transfer_coefficient_conduction_surface']
@@ -1369,7 +1389,7 @@ class BuildingModel(object):
                             * (1 - surface_data.at['window_wall_ratio'])
                             * (
                                 1.0
-                                / building_data.parameters.at['heat_transfer_coefficient_interior_convection']
+                                / heat_transfer_coefficient_interior_convection
                                 + 1.0
                                 / (
                                     2.0
@@ -1386,7 +1406,7 @@ class BuildingModel(object):
                             * (1 - surface_data.at['window_wall_ratio'])
                             * (
                                 1.0
-                                / building_data.parameters.at['heat_transfer_coefficient_interior_convection']
+                                / heat_transfer_coefficient_interior_convection
                                 + 1.0
                                 / (
                                     2.0
@@ -1417,7 +1437,7 @@ class BuildingModel(object):
                                 * (1 - surface_data.at['window_wall_ratio'])
                                 * (1.0 - (
                                     1.0
-                                    + building_data.parameters.at['heat_transfer_coefficient_interior_convection']
+                                    + heat_transfer_coefficient_interior_convection
                                     / (
                                         2.0
                                         * surface_data.at['heat_transfer_coefficient_conduction_surface']
@@ -1433,7 +1453,7 @@ class BuildingModel(object):
                             * (1 - surface_data.at['window_wall_ratio'])
                             * (
                                 1.0
-                                / building_data.parameters.at['heat_transfer_coefficient_interior_convection']
+                                / heat_transfer_coefficient_interior_convection
                                 + 1.0
                                 / (
                                     2.0
@@ -1451,7 +1471,7 @@ class BuildingModel(object):
                             * (1 - surface_data.at['window_wall_ratio'])
                             * (
                                 1.0
-                                / building_data.parameters.at['heat_transfer_coefficient_interior_convection']
+                                / heat_transfer_coefficient_interior_convection
                                 + 1.0
                                 / (
                                     2.0
@@ -1511,9 +1531,9 @@ class BuildingModel(object):
                                 * (1 - surface_data.at['window_wall_ratio'])
                                 * (
                                     1.0
-                                    + building_data.parameters.at['heat_transfer_coefficient_interior_convection']
-                                    / building_data.parameters.at['heat_transfer_coefficient_interior_convection']
-                                    + building_data.parameters.at['heat_transfer_coefficient_interior_convection']
+                                    + heat_transfer_coefficient_interior_convection
+                                    / heat_transfer_coefficient_interior_convection
+                                    + heat_transfer_coefficient_interior_convection
                                     / surface_data.at['heat_transfer_coefficient_conduction_surface']
                                 ) ** (- 1)
                                 / building_data.zones.at[zone_name, 'heat_capacity']
@@ -1526,9 +1546,9 @@ class BuildingModel(object):
                             * (1 - surface_data.at['window_wall_ratio'])
                             * (
                                 1.0
-                                / building_data.parameters.at['heat_transfer_coefficient_interior_convection']
+                                / heat_transfer_coefficient_interior_convection
                                 + 1.0
-                                / building_data.parameters.at['heat_transfer_coefficient_interior_convection']
+                                / heat_transfer_coefficient_interior_convection
                                 + 1.0
                                 / surface_data.at['heat_transfer_coefficient_conduction_surface']
                             ) ** (- 1)
@@ -1543,9 +1563,9 @@ class BuildingModel(object):
                             * (1 - surface_data.at['window_wall_ratio'])
                             * (
                                 1.0
-                                / building_data.parameters.at['heat_transfer_coefficient_interior_convection']
+                                / heat_transfer_coefficient_interior_convection
                                 + 1.0
-                                / building_data.parameters.at['heat_transfer_coefficient_interior_convection']
+                                / heat_transfer_coefficient_interior_convection
                                 + 1.0
                                 / surface_data.at['heat_transfer_coefficient_conduction_surface']
                             ) ** (- 1)
@@ -1571,9 +1591,9 @@ class BuildingModel(object):
                                 * (1 - surface_data.at['window_wall_ratio'])
                                 * (1.0 - (
                                     1.0
-                                    + building_data.parameters.at['heat_transfer_coefficient_interior_convection']
-                                    / building_data.parameters.at['heat_transfer_coefficient_interior_convection']
-                                    + building_data.parameters.at['heat_transfer_coefficient_interior_convection']
+                                    + heat_transfer_coefficient_interior_convection
+                                    / heat_transfer_coefficient_interior_convection
+                                    + heat_transfer_coefficient_interior_convection
                                     / surface_data.at['heat_transfer_coefficient_conduction_surface']
                                 ) ** (- 1))
                                 / building_data.zones.at[zone_name, 'heat_capacity']
@@ -1631,9 +1651,9 @@ class BuildingModel(object):
                                 * surface_data.at['window_wall_ratio']
                                 * (
                                     1.0
-                                    + building_data.parameters.at['heat_transfer_coefficient_interior_convection']
-                                    / building_data.parameters.at['heat_transfer_coefficient_interior_convection']
-                                    + building_data.parameters.at['heat_transfer_coefficient_interior_convection']
+                                    + heat_transfer_coefficient_interior_convection
+                                    / heat_transfer_coefficient_interior_convection
+                                    + heat_transfer_coefficient_interior_convection
                                     / surface_data.at['heat_transfer_coefficient_conduction_window']
                                 ) ** (- 1)
                                 / building_data.zones.at[zone_name, 'heat_capacity']
@@ -1646,9 +1666,9 @@ class BuildingModel(object):
                             * surface_data.at['window_wall_ratio']
                             * (
                                 1.0
-                                / building_data.parameters.at['heat_transfer_coefficient_interior_convection']
+                                / heat_transfer_coefficient_interior_convection
                                 + 1.0
-                                / building_data.parameters.at['heat_transfer_coefficient_interior_convection']
+                                / heat_transfer_coefficient_interior_convection
                                 + 1.0
                                 / surface_data.at['heat_transfer_coefficient_conduction_window']
                             ) ** (- 1)
@@ -1663,9 +1683,9 @@ class BuildingModel(object):
                             * surface_data.at['window_wall_ratio']
                             * (
                                 1.0
-                                / building_data.parameters.at['heat_transfer_coefficient_interior_convection']
+                                / heat_transfer_coefficient_interior_convection
                                 + 1.0
-                                / building_data.parameters.at['heat_transfer_coefficient_interior_convection']
+                                / heat_transfer_coefficient_interior_convection
                                 + 1.0
                                 / surface_data.at['heat_transfer_coefficient_conduction_window']
                             ) ** (- 1)
@@ -1691,9 +1711,9 @@ class BuildingModel(object):
                                 * surface_data.at['window_wall_ratio']
                                 * (1.0 - (
                                     1.0
-                                    + building_data.parameters.at['heat_transfer_coefficient_interior_convection']
-                                    / building_data.parameters.at['heat_transfer_coefficient_interior_convection']
-                                    + building_data.parameters.at['heat_transfer_coefficient_interior_convection']
+                                    + heat_transfer_coefficient_interior_convection
+                                    / heat_transfer_coefficient_interior_convection
+                                    + heat_transfer_coefficient_interior_convection
                                     / surface_data.at['heat_transfer_coefficient_conduction_window']
                                 ) ** (- 1))
                                 / building_data.zones.at[zone_name, 'heat_capacity']
@@ -1726,7 +1746,7 @@ class BuildingModel(object):
                             * (
                                 1.0
                                 + (
-                                    building_data.parameters.at['heat_transfer_coefficient_interior_convection']
+                                    heat_transfer_coefficient_interior_convection
                                 )
                                 / (
                                     2.0
@@ -1745,7 +1765,7 @@ class BuildingModel(object):
                         * (
                             1.0
                             / (
-                                building_data.parameters.at['heat_transfer_coefficient_interior_convection']
+                                heat_transfer_coefficient_interior_convection
                             )
                             + 1.0
                             / (
@@ -1764,7 +1784,7 @@ class BuildingModel(object):
                         * (
                             1.0
                             / (
-                                building_data.parameters.at['heat_transfer_coefficient_interior_convection']
+                                heat_transfer_coefficient_interior_convection
                             )
                             + 1.0
                             / (
@@ -1797,7 +1817,7 @@ class BuildingModel(object):
                             * (1.0 - (
                                 1.0
                                 + (
-                                    building_data.parameters.at['heat_transfer_coefficient_interior_convection']
+                                    heat_transfer_coefficient_interior_convection
                                 )
                                 / (
                                     2.0
@@ -1815,7 +1835,7 @@ class BuildingModel(object):
                         * (
                             1.0
                             / (
-                                building_data.parameters.at['heat_transfer_coefficient_interior_convection']
+                                heat_transfer_coefficient_interior_convection
                             )
                             + 1.0
                             / (
@@ -1835,7 +1855,7 @@ class BuildingModel(object):
                         * (
                             1.0
                             / (
-                                building_data.parameters.at['heat_transfer_coefficient_interior_convection']
+                                heat_transfer_coefficient_interior_convection
                             )
                             + 1.0
                             / (
@@ -1859,7 +1879,7 @@ class BuildingModel(object):
                     * zone_data.at['infiltration_rate']
                     / 3600  # 1/h in 1/s.
                     * zone_data.at['zone_volume']
-                    * building_data.parameters.at['heat_capacity_air']
+                    * heat_capacity_air
                     / zone_data.at['heat_capacity']
                 )
                 disturbance_matrix[
@@ -1869,52 +1889,58 @@ class BuildingModel(object):
                     zone_data.at['infiltration_rate']
                     / 3600  # 1/h in 1/s.
                     * zone_data.at['zone_volume']
-                    * building_data.parameters.at['heat_capacity_air']
+                    * heat_capacity_air
                     / zone_data.at['heat_capacity']
                 )
 
         def define_heat_transfer_internal_gains():
 
-            for zone_name, zone_data in building_data.zones.iterrows():
-                if pd.notnull(zone_data.at['internal_gain_type']):
-                    disturbance_matrix[
-                        f'{zone_name}_temperature',
-                        zone_data.at['internal_gain_type'] + '_internal_gain_occupancy'
-                    ] += (
-                        zone_data.at['occupancy_density']
-                        * zone_data.at['occupancy_heat_gain']
-                        * zone_data.at['zone_area']
-                        / zone_data.at['heat_capacity']
-                    )
-                    disturbance_matrix[
-                        f'{zone_name}_temperature',
-                        zone_data.at['internal_gain_type'] + '_internal_gain_appliances'
-                    ] += (
-                        zone_data.at['appliances_heat_gain']
-                        * zone_data.at['zone_area']
-                        / zone_data.at['heat_capacity']
-                    )
+            for zone_name, zone_data in (
+                    building_data.zones[
+                        pd.notnull(building_data.zones['internal_gain_type'])
+                    ].iterrows()
+            ):
+                disturbance_matrix[
+                    f'{zone_name}_temperature',
+                    zone_data.at['internal_gain_type'] + '_internal_gain_occupancy'
+                ] += (
+                    zone_data.at['occupancy_density']
+                    * zone_data.at['occupancy_heat_gain']
+                    * zone_data.at['zone_area']
+                    / zone_data.at['heat_capacity']
+                )
+                disturbance_matrix[
+                    f'{zone_name}_temperature',
+                    zone_data.at['internal_gain_type'] + '_internal_gain_appliances'
+                ] += (
+                    zone_data.at['appliances_heat_gain']
+                    * zone_data.at['zone_area']
+                    / zone_data.at['heat_capacity']
+                )
 
         def define_heat_transfer_hvac_generic():
 
-            for zone_name, zone_data in building_data.zones.iterrows():
-                if pd.notnull(zone_data.at['hvac_generic_type']):
-                    control_matrix[
-                        f'{zone_name}_temperature',
-                        f'{zone_name}_generic_heat_thermal_power'
-                    ] += (
-                        1.0
-                        * zone_data.at['zone_area']
-                        / zone_data.at['heat_capacity']
-                    )
-                    control_matrix[
-                        f'{zone_name}_temperature',
-                        f'{zone_name}_generic_cool_thermal_power'
-                    ] += (
-                        - 1.0
-                        * zone_data.at['zone_area']
-                        / zone_data.at['heat_capacity']
-                    )
+            for zone_name, zone_data in (
+                    building_data.zones[
+                        pd.notnull(building_data.zones['hvac_generic_type'])
+                    ].iterrows()
+            ):
+                control_matrix[
+                    f'{zone_name}_temperature',
+                    f'{zone_name}_generic_heat_thermal_power'
+                ] += (
+                    1.0
+                    * zone_data.at['zone_area']
+                    / zone_data.at['heat_capacity']
+                )
+                control_matrix[
+                    f'{zone_name}_temperature',
+                    f'{zone_name}_generic_cool_thermal_power'
+                ] += (
+                    - 1.0
+                    * zone_data.at['zone_area']
+                    / zone_data.at['heat_capacity']
+                )
 
         def define_heat_transfer_hvac_radiator():
             """Define state equations describing the heat transfer occurring due to radiators."""
@@ -2319,269 +2345,284 @@ class BuildingModel(object):
 
         def define_heat_transfer_hvac_ahu():
 
-            for zone_name, zone_data in building_data.zones.iterrows():
-                if pd.notnull(zone_data.at['hvac_ahu_type']):
-                    control_matrix[
-                        f'{zone_name}_temperature',
-                        f'{zone_name}_ahu_heat_air_flow'
-                    ] += (
-                        1.0
-                        / 1000  # l in m³.
-                        * zone_data.at['zone_area']
-                        * building_data.parameters.at['heat_capacity_air']
-                        * (
-                            zone_data.at['ahu_supply_air_temperature_setpoint']
-                            - building_data.scenarios.at['linearization_zone_air_temperature_heat']
-                        )
-                        / zone_data.at['heat_capacity']
+            for zone_name, zone_data in (
+                    building_data.zones[
+                        pd.notnull(building_data.zones['hvac_ahu_type'])
+                    ].iterrows()
+            ):
+                control_matrix[
+                    f'{zone_name}_temperature',
+                    f'{zone_name}_ahu_heat_air_flow'
+                ] += (
+                    1.0
+                    / 1000  # l in m³.
+                    * zone_data.at['zone_area']
+                    * heat_capacity_air
+                    * (
+                        zone_data.at['ahu_supply_air_temperature_setpoint']
+                        - building_data.scenarios.at['linearization_zone_air_temperature_heat']
                     )
-                    control_matrix[
-                        f'{zone_name}_temperature',
-                        f'{zone_name}_ahu_cool_air_flow'
-                    ] += (
-                        1.0
-                        / 1000  # l in m³.
-                        * zone_data.at['zone_area']
-                        * building_data.parameters.at['heat_capacity_air']
-                        * (
-                            zone_data.at['ahu_supply_air_temperature_setpoint']
-                            - building_data.scenarios.at['linearization_zone_air_temperature_cool']
-                        )
-                        / zone_data.at['heat_capacity']
+                    / zone_data.at['heat_capacity']
+                )
+                control_matrix[
+                    f'{zone_name}_temperature',
+                    f'{zone_name}_ahu_cool_air_flow'
+                ] += (
+                    1.0
+                    / 1000  # l in m³.
+                    * zone_data.at['zone_area']
+                    * heat_capacity_air
+                    * (
+                        zone_data.at['ahu_supply_air_temperature_setpoint']
+                        - building_data.scenarios.at['linearization_zone_air_temperature_cool']
                     )
+                    / zone_data.at['heat_capacity']
+                )
 
         def define_heat_transfer_hvac_tu():
 
-            for zone_name, zone_data in building_data.zones.iterrows():
-                if pd.notnull(zone_data.at['hvac_tu_type']):
-                    control_matrix[
-                        f'{zone_name}_temperature',
-                        f'{zone_name}_tu_heat_air_flow'
-                    ] += (
-                        1.0
-                        / 1000  # l in m³.
-                        * zone_data.at['zone_area']
-                        * building_data.parameters.at['heat_capacity_air']
-                        * (
-                            zone_data.at['tu_supply_air_temperature_setpoint']
-                            - building_data.scenarios.at['linearization_zone_air_temperature_heat']
-                        )
-                        / zone_data.at['heat_capacity']
+            for zone_name, zone_data in (
+                    building_data.zones[
+                        pd.notnull(building_data.zones['hvac_tu_type'])
+                    ].iterrows()
+            ):
+                control_matrix[
+                    f'{zone_name}_temperature',
+                    f'{zone_name}_tu_heat_air_flow'
+                ] += (
+                    1.0
+                    / 1000  # l in m³.
+                    * zone_data.at['zone_area']
+                    * heat_capacity_air
+                    * (
+                        zone_data.at['tu_supply_air_temperature_setpoint']
+                        - building_data.scenarios.at['linearization_zone_air_temperature_heat']
                     )
-                    control_matrix[
-                        f'{zone_name}_temperature',
-                        f'{zone_name}_tu_cool_air_flow'
-                    ] += (
-                        1.0
-                        / 1000  # l in m³.
-                        * zone_data.at['zone_area']
-                        * building_data.parameters.at['heat_capacity_air']
-                        * (
-                            zone_data.at['tu_supply_air_temperature_setpoint']
-                            - building_data.scenarios.at['linearization_zone_air_temperature_cool']
-                        )
-                        / zone_data.at['heat_capacity']
+                    / zone_data.at['heat_capacity']
+                )
+                control_matrix[
+                    f'{zone_name}_temperature',
+                    f'{zone_name}_tu_cool_air_flow'
+                ] += (
+                    1.0
+                    / 1000  # l in m³.
+                    * zone_data.at['zone_area']
+                    * heat_capacity_air
+                    * (
+                        zone_data.at['tu_supply_air_temperature_setpoint']
+                        - building_data.scenarios.at['linearization_zone_air_temperature_cool']
                     )
+                    / zone_data.at['heat_capacity']
+                )
 
         def define_heat_transfer_hvac_vent():
 
-            for zone_name, zone_data in building_data.zones.iterrows():
-                if pd.notnull(zone_data.at['hvac_vent_type']):
+            for zone_name, zone_data in (
+                    building_data.zones[
+                        pd.notnull(building_data.zones['hvac_vent_type'])
+                    ].iterrows()
+            ):
+                control_matrix[
+                    f'{zone_name}_temperature',
+                    f'{zone_name}_vent_air_flow'
+                ] += (
+                    1.0
+                    / 1000  # l in m³.
+                    * zone_data.at['zone_area']
+                    * heat_capacity_air
+                    * (
+                        building_data.scenarios.at['linearization_ambient_air_temperature']
+                        - building_data.scenarios.at['linearization_zone_air_temperature']
+                    )
+                    / zone_data.at['heat_capacity']
+                )
+
+        def define_co2_transfer():
+
+            for zone_name, zone_data in (
+                    building_data.zones[
+                        building_data.zones['fresh_air_flow_control_type'] == 'co2_based'
+                    ].iterrows()
+            ):
+                state_matrix[
+                    f'{zone_name}_co2_concentration',
+                    f'{zone_name}_co2_concentration'
+                ] += (
+                    - 1.0
+                    * building_data.scenarios.at['linearization_zone_fresh_air_flow']
+                    / 1000  # l in m³.
+                    * zone_data.at['zone_area']
+                    / zone_data.at['zone_volume']
+                )
+                if pd.notnull(zone_data.at['hvac_ahu_type']):
                     control_matrix[
-                        f'{zone_name}_temperature',
-                        f'{zone_name}_vent_air_flow'
+                        f'{zone_name}_co2_concentration',
+                        f'{zone_name}_ahu_heat_air_flow'
                     ] += (
-                        1.0
+                        - 1.0
                         / 1000  # l in m³.
                         * zone_data.at['zone_area']
-                        * building_data.parameters.at['heat_capacity_air']
-                        * (
-                            building_data.scenarios.at['linearization_ambient_air_temperature']
-                            - building_data.scenarios.at['linearization_zone_air_temperature']
-                        )
-                        / zone_data.at['heat_capacity']
+                        * building_data.scenarios.at['linearization_zone_air_co2_concentration']
+                        / zone_data.at['zone_volume']
                     )
-
-        def define_co2_transfer():
-
-            for zone_name, zone_data in building_data.zones.iterrows():
-                if zone_data.at['fresh_air_flow_control_type'] == 'co2_based':
-                    state_matrix[
+                    control_matrix[
                         f'{zone_name}_co2_concentration',
-                        f'{zone_name}_co2_concentration'
+                        f'{zone_name}_ahu_cool_air_flow'
                     ] += (
                         - 1.0
-                        * building_data.scenarios.at['linearization_zone_fresh_air_flow']
                         / 1000  # l in m³.
                         * zone_data.at['zone_area']
+                        * building_data.scenarios.at['linearization_zone_air_co2_concentration']
                         / zone_data.at['zone_volume']
                     )
-                    if pd.notnull(zone_data.at['hvac_ahu_type']):
-                        control_matrix[
-                            f'{zone_name}_co2_concentration',
-                            f'{zone_name}_ahu_heat_air_flow'
-                        ] += (
-                            - 1.0
-                            / 1000  # l in m³.
-                            * zone_data.at['zone_area']
-                            * building_data.scenarios.at['linearization_zone_air_co2_concentration']
-                            / zone_data.at['zone_volume']
-                        )
-                        control_matrix[
-                            f'{zone_name}_co2_concentration',
-                            f'{zone_name}_ahu_cool_air_flow'
-                        ] += (
-                            - 1.0
-                            / 1000  # l in m³.
-                            * zone_data.at['zone_area']
-                            * building_data.scenarios.at['linearization_zone_air_co2_concentration']
-                            / zone_data.at['zone_volume']
-                        )
-                    if pd.notnull(zone_data.at['hvac_vent_type']):
-                        control_matrix[
-                            f'{zone_name}_co2_concentration',
-                            f'{zone_name}_vent_air_flow'
-                        ] += (
-                            - 1.0
-                            / 1000  # l in m³.
-                            * zone_data.at['zone_area']
-                            * building_data.scenarios.at['linearization_zone_air_co2_concentration']
-                            / zone_data.at['zone_volume']
-                        )
-                    disturbance_matrix[
+                if pd.notnull(zone_data.at['hvac_vent_type']):
+                    control_matrix[
                         f'{zone_name}_co2_concentration',
-                        'constant'
+                        f'{zone_name}_vent_air_flow'
                     ] += (
                         - 1.0
-                        * zone_data.at['infiltration_rate']
-                        / 3600  # 1/h in 1/s.
-                        * zone_data.at['zone_volume']
+                        / 1000  # l in m³.
+                        * zone_data.at['zone_area']
                         * building_data.scenarios.at['linearization_zone_air_co2_concentration']
+                        / zone_data.at['zone_volume']
                     )
-                    if pd.notnull(zone_data.at['internal_gain_type']):
-                        disturbance_matrix[
-                            f'{zone_name}_co2_concentration',
-                            zone_data.at['internal_gain_type'] + '_internal_gain_occupancy'
-                        ] += (
-                            1.0
-                            * zone_data.at['occupancy_density']
-                            * zone_data.at['occupancy_co2_gain']
-                            / zone_data.at['zone_volume']
-                        )
+                disturbance_matrix[
+                    f'{zone_name}_co2_concentration',
+                    'constant'
+                ] += (
+                    - 1.0
+                    * zone_data.at['infiltration_rate']
+                    / 3600  # 1/h in 1/s.
+                    * zone_data.at['zone_volume']
+                    * building_data.scenarios.at['linearization_zone_air_co2_concentration']
+                )
+                if pd.notnull(zone_data.at['internal_gain_type']):
                     disturbance_matrix[
                         f'{zone_name}_co2_concentration',
-                        'constant'
+                        zone_data.at['internal_gain_type'] + '_internal_gain_occupancy'
                     ] += (
                         1.0
-                        * building_data.scenarios.at['linearization_zone_fresh_air_flow']
-                        / 1000  # l in m³.
-                        * zone_data.at['zone_area']
-                        * building_data.scenarios.at['linearization_zone_air_co2_concentration']
+                        * zone_data.at['occupancy_density']
+                        * zone_data.at['occupancy_co2_gain']
                         / zone_data.at['zone_volume']
                     )
+                disturbance_matrix[
+                    f'{zone_name}_co2_concentration',
+                    'constant'
+                ] += (
+                    1.0
+                    * building_data.scenarios.at['linearization_zone_fresh_air_flow']
+                    / 1000  # l in m³.
+                    * zone_data.at['zone_area']
+                    * building_data.scenarios.at['linearization_zone_air_co2_concentration']
+                    / zone_data.at['zone_volume']
+                )
 
         def define_humidity_transfer():
 
             # TODO: Change absolute humidity unit from kg/kg to g/kg for numerical performance.
-            for zone_name, zone_data in building_data.zones.iterrows():
-                if zone_data.at['humidity_control_type'] == 'humidity_based':
-                    state_matrix[
+            for zone_name, zone_data in (
+                    building_data.zones[
+                        building_data.zones['humidity_control_type'] == 'humidity_based'
+                    ].iterrows()
+            ):
+                state_matrix[
+                    f'{zone_name}_absolute_humidity',
+                    f'{zone_name}_absolute_humidity'
+                ] += (
+                    - 1.0
+                    * building_data.scenarios.at['linearization_zone_fresh_air_flow']
+                    / 1000  # l in m³.
+                    * zone_data.at['zone_area']
+                    * density_air
+                    / zone_data.at['zone_air_mass']
+                )
+                if pd.notnull(zone_data.at['hvac_ahu_type']):
+                    control_matrix[
                         f'{zone_name}_absolute_humidity',
-                        f'{zone_name}_absolute_humidity'
+                        f'{zone_name}_ahu_heat_air_flow'
                     ] += (
                         - 1.0
-                        * building_data.scenarios.at['linearization_zone_fresh_air_flow']
                         / 1000  # l in m³.
                         * zone_data.at['zone_area']
-                        * building_data.parameters.at['density_air']
-                        / zone_data.at['zone_air_mass']
-                    )
-                    if pd.notnull(zone_data.at['hvac_ahu_type']):
-                        control_matrix[
-                            f'{zone_name}_absolute_humidity',
-                            f'{zone_name}_ahu_heat_air_flow'
-                        ] += (
-                            - 1.0
-                            / 1000  # l in m³.
-                            * zone_data.at['zone_area']
-                            * building_data.parameters.at['density_air']
-                            * (
-                                building_data.scenarios.at['linearization_zone_air_absolute_humidity']
-                                - cobmo.utils.calculate_absolute_humidity_humid_air(
-                                    zone_data.at['ahu_supply_air_temperature_setpoint'],
-                                    zone_data.at['ahu_supply_air_relative_humidity_setpoint']
-                                )
-                            )
-                            / zone_data.at['zone_air_mass']
-                        )
-                        control_matrix[
-                            f'{zone_name}_absolute_humidity',
-                            f'{zone_name}_ahu_cool_air_flow'
-                        ] += (
-                            - 1.0
-                            / 1000  # l in m³.
-                            * zone_data.at['zone_area']
-                            * building_data.parameters.at['density_air']
-                            * (
-                                building_data.scenarios.at['linearization_zone_air_absolute_humidity']
-                                - cobmo.utils.calculate_absolute_humidity_humid_air(
-                                    zone_data.at['ahu_supply_air_temperature_setpoint'],
-                                    zone_data.at['ahu_supply_air_relative_humidity_setpoint']
-                                )
+                        * density_air
+                        * (
+                            building_data.scenarios.at['linearization_zone_air_absolute_humidity']
+                            - cobmo.utils.calculate_absolute_humidity_humid_air(
+                                zone_data.at['ahu_supply_air_temperature_setpoint'],
+                                zone_data.at['ahu_supply_air_relative_humidity_setpoint']
                             )
-                            / zone_data.at['zone_air_mass']
                         )
-                    if pd.notnull(zone_data.at['hvac_vent_type']):
-                        control_matrix[
-                            f'{zone_name}_absolute_humidity',
-                            f'{zone_name}_vent_air_flow'
-                        ] += (
-                            - 1.0
-                            / 1000  # l in m³.
-                            * zone_data.at['zone_area']
-                            * building_data.parameters.at['density_air']
-                            * (
-                                building_data.scenarios.at['linearization_zone_air_absolute_humidity']
-                                - building_data.scenarios.at['linearization_ambient_air_absolute_humidity']
+                        / zone_data.at['zone_air_mass']
+                    )
+                    control_matrix[
+                        f'{zone_name}_absolute_humidity',
+                        f'{zone_name}_ahu_cool_air_flow'
+                    ] += (
+                        - 1.0
+                        / 1000  # l in m³.
+                        * zone_data.at['zone_area']
+                        * density_air
+                        * (
+                            building_data.scenarios.at['linearization_zone_air_absolute_humidity']
+                            - cobmo.utils.calculate_absolute_humidity_humid_air(
+                                zone_data.at['ahu_supply_air_temperature_setpoint'],
+                                zone_data.at['ahu_supply_air_relative_humidity_setpoint']
                             )
-                            / zone_data.at['zone_air_mass']
                         )
-                    disturbance_matrix[
+                        / zone_data.at['zone_air_mass']
+                    )
+                if pd.notnull(zone_data.at['hvac_vent_type']):
+                    control_matrix[
                         f'{zone_name}_absolute_humidity',
-                        'constant'
+                        f'{zone_name}_vent_air_flow'
                     ] += (
                         - 1.0
-                        * zone_data.at['infiltration_rate']
-                        / 3600  # 1/h in 1/s.
-                        * zone_data.at['zone_volume']
-                        * building_data.parameters.at['density_air']
+                        / 1000  # l in m³.
+                        * zone_data.at['zone_area']
+                        * density_air
                         * (
                             building_data.scenarios.at['linearization_zone_air_absolute_humidity']
                             - building_data.scenarios.at['linearization_ambient_air_absolute_humidity']
                         )
                         / zone_data.at['zone_air_mass']
                     )
-                    if pd.notnull(zone_data.at['internal_gain_type']):
-                        disturbance_matrix[
-                            f'{zone_name}_absolute_humidity',
-                            zone_data.at['internal_gain_type'] + '_internal_gain_occupancy'
-                        ] += (
-                            1.0
-                            * zone_data.at['occupancy_density']
-                            * zone_data.at['occupancy_humidity_gain']
-                            / 1000  # kg in g.
-                            / zone_data.at['zone_air_mass']
-                        )
+                disturbance_matrix[
+                    f'{zone_name}_absolute_humidity',
+                    'constant'
+                ] += (
+                    - 1.0
+                    * zone_data.at['infiltration_rate']
+                    / 3600  # 1/h in 1/s.
+                    * zone_data.at['zone_volume']
+                    * density_air
+                    * (
+                        building_data.scenarios.at['linearization_zone_air_absolute_humidity']
+                        - building_data.scenarios.at['linearization_ambient_air_absolute_humidity']
+                    )
+                    / zone_data.at['zone_air_mass']
+                )
+                if pd.notnull(zone_data.at['internal_gain_type']):
                     disturbance_matrix[
                         f'{zone_name}_absolute_humidity',
-                        'constant'
+                        zone_data.at['internal_gain_type'] + '_internal_gain_occupancy'
                     ] += (
                         1.0
-                        * building_data.scenarios.at['linearization_zone_fresh_air_flow']
-                        / 1000  # l in m³.
-                        * building_data.scenarios.at['linearization_zone_air_absolute_humidity']
-                        / zone_data.at['zone_height']
+                        * zone_data.at['occupancy_density']
+                        * zone_data.at['occupancy_humidity_gain']
+                        / 1000  # kg in g.
+                        / zone_data.at['zone_air_mass']
                     )
+                disturbance_matrix[
+                    f'{zone_name}_absolute_humidity',
+                    'constant'
+                ] += (
+                    1.0
+                    * building_data.scenarios.at['linearization_zone_fresh_air_flow']
+                    / 1000  # l in m³.
+                    * building_data.scenarios.at['linearization_zone_air_absolute_humidity']
+                    / zone_data.at['zone_height']
+                )
 
         def define_storage_state_of_charge():
 
@@ -2596,8 +2637,8 @@ class BuildingModel(object):
                     100.0  # in %.
                     * building_data.scenarios.at['storage_round_trip_efficiency']
                     / building_data.scenarios.at['storage_capacity']
-                    / building_data.parameters.at['water_density']
-                    / building_data.parameters.at['water_specific_heat']
+                    / water_density
+                    / water_specific_heat
                     / building_data.scenarios.at['storage_sensible_temperature_delta']
                 )
 
@@ -2608,8 +2649,8 @@ class BuildingModel(object):
                 ] += (
                     - 100.0  # in %.
                     / building_data.scenarios.at['storage_capacity']
-                    / building_data.parameters.at['water_density']
-                    / building_data.parameters.at['water_specific_heat']
+                    / water_density
+                    / water_specific_heat
                     / building_data.scenarios.at['storage_sensible_temperature_delta']
                 )
 
@@ -2624,8 +2665,8 @@ class BuildingModel(object):
                     100.0  # in %.
                     * building_data.scenarios.at['storage_round_trip_efficiency']
                     / building_data.scenarios.at['storage_capacity']
-                    / building_data.parameters.at['water_density']
-                    / building_data.parameters.at['water_specific_heat']
+                    / water_density
+                    / water_specific_heat
                     / building_data.scenarios.at['storage_sensible_temperature_delta']
                 )
 
@@ -2636,8 +2677,8 @@ class BuildingModel(object):
                 ] += (
                     - 100.0  # in %.
                     / building_data.scenarios.at['storage_capacity']
-                    / building_data.parameters.at['water_density']
-                    / building_data.parameters.at['water_specific_heat']
+                    / water_density
+                    / water_specific_heat
                     / building_data.scenarios.at['storage_sensible_temperature_delta']
                 )
 
@@ -2688,413 +2729,437 @@ class BuildingModel(object):
 
         def define_output_zone_co2_concentration():
 
-            for zone_name, zone_data in building_data.zones.iterrows():
-                if zone_data.at['fresh_air_flow_control_type'] == 'co2_based':
-                    state_output_matrix[
-                        f'{zone_name}_co2_concentration',
-                        f'{zone_name}_co2_concentration'
-                    ] = 1.0
+            for zone_name, zone_data in (
+                    building_data.zones[
+                        building_data.zones['fresh_air_flow_control_type'] == 'co2_based'
+                    ].iterrows()
+            ):
+                state_output_matrix[
+                    f'{zone_name}_co2_concentration',
+                    f'{zone_name}_co2_concentration'
+                ] = 1.0
 
         def define_output_zone_humidity():
 
-            for zone_name, zone_data in building_data.zones.iterrows():
-                if zone_data.at['humidity_control_type'] == 'humidity_based':
-                    state_output_matrix[
-                        f'{zone_name}_absolute_humidity',
-                        f'{zone_name}_absolute_humidity'
-                    ] = 1.0
+            for zone_name, zone_data in (
+                    building_data.zones[
+                        building_data.zones['humidity_control_type'] == 'humidity_based'
+                    ].iterrows()
+            ):
+                state_output_matrix[
+                    f'{zone_name}_absolute_humidity',
+                    f'{zone_name}_absolute_humidity'
+                ] = 1.0
 
         def define_output_internal_gain_power():
 
-            for zone_name, zone_data in building_data.zones.iterrows():
-                if pd.notnull(zone_data.at['internal_gain_type']):
+            for zone_name, zone_data in (
+                    building_data.zones[
+                        pd.notnull(building_data.zones['internal_gain_type'])
+                    ].iterrows()
+            ):
 
-                    # Electric power due to appliances.
+                # Electric power due to appliances.
+                disturbance_output_matrix[
+                    'electric_power_balance',
+                    zone_data.at['internal_gain_type'] + '_internal_gain_appliances'
+                ] += (
+                    1.0
+                    * zone_data.at['appliances_heat_gain']
+                    * zone_data.at['zone_area']
+                    / self.zone_area_total
+                )
+
+                # Thermal power heating due to warm water demand.
+                if pd.notnull(zone_data.at['warm_water_demand_thermal_power']):
                     disturbance_output_matrix[
-                        'electric_power_balance',
-                        zone_data.at['internal_gain_type'] + '_internal_gain_appliances'
+                        'thermal_power_heating_balance',
+                        zone_data.at['internal_gain_type'] + '_warm_water_demand'
                     ] += (
                         1.0
-                        * zone_data.at['appliances_heat_gain']
+                        * zone_data.at['warm_water_demand_thermal_power']
                         * zone_data.at['zone_area']
                         / self.zone_area_total
                     )
 
-                    # Thermal power heating due to warm water demand.
-                    if pd.notnull(zone_data.at['warm_water_demand_thermal_power']):
-                        disturbance_output_matrix[
-                            'thermal_power_heating_balance',
-                            zone_data.at['internal_gain_type'] + '_warm_water_demand'
-                        ] += (
-                            1.0
-                            * zone_data.at['warm_water_demand_thermal_power']
-                            * zone_data.at['zone_area']
-                            / self.zone_area_total
-                        )
-
         def define_output_hvac_generic():
 
-            for zone_name, zone_data in building_data.zones.iterrows():
-                if pd.notnull(zone_data.at['hvac_generic_type']):
+            for zone_name, zone_data in (
+                    building_data.zones[
+                        pd.notnull(building_data.zones['hvac_generic_type'])
+                    ].iterrows()
+            ):
 
-                    # Cooling power.
-                    control_output_matrix[
-                        f'{zone_name}_generic_cool_thermal_power',
-                        f'{zone_name}_generic_cool_thermal_power'
-                    ] = 1.0
-                    control_output_matrix[
-                        'thermal_power_cooling_balance',
-                        f'{zone_name}_generic_cool_thermal_power'
-                    ] = (
-                        1.0
-                        / zone_data.at['generic_cooling_efficiency']
-                        * zone_data.at['zone_area']
-                        / self.zone_area_total
-                    )
+                # Cooling power.
+                control_output_matrix[
+                    f'{zone_name}_generic_cool_thermal_power',
+                    f'{zone_name}_generic_cool_thermal_power'
+                ] = 1.0
+                control_output_matrix[
+                    'thermal_power_cooling_balance',
+                    f'{zone_name}_generic_cool_thermal_power'
+                ] = (
+                    1.0
+                    / zone_data.at['generic_cooling_efficiency']
+                    * zone_data.at['zone_area']
+                    / self.zone_area_total
+                )
+
+                # Heating power.
+                control_output_matrix[
+                    f'{zone_name}_generic_heat_thermal_power',
+                    f'{zone_name}_generic_heat_thermal_power'
+                ] = 1.0
+                control_output_matrix[
+                    'thermal_power_heating_balance',
+                    f'{zone_name}_generic_heat_thermal_power'
+                ] = (
+                    1.0
+                    / zone_data.at['generic_heating_efficiency']
+                    * zone_data.at['zone_area']
+                    / self.zone_area_total
+                )
+
+        def define_output_hvac_radiator_power():
 
-                    # Heating power.
+            if pd.notnull(building_data.zones['hvac_radiator_type']).any():
+                for zone_name, zone_data in (
+                        building_data.zones[
+                            pd.notnull(building_data.zones['hvac_radiator_type'])
+                        ].iterrows()
+                ):
+
+                    # Heating power (radiators do not require cooling power).
                     control_output_matrix[
-                        f'{zone_name}_generic_heat_thermal_power',
-                        f'{zone_name}_generic_heat_thermal_power'
+                        f'{zone_name}_radiator_thermal_power',
+                        f'{zone_name}_radiator_thermal_power'
                     ] = 1.0
                     control_output_matrix[
                         'thermal_power_heating_balance',
-                        f'{zone_name}_generic_heat_thermal_power'
+                        f'{zone_name}_radiator_thermal_power'
                     ] = (
                         1.0
-                        / zone_data.at['generic_heating_efficiency']
+                        / zone_data.at['radiator_heating_efficiency']
                         * zone_data.at['zone_area']
                         / self.zone_area_total
                     )
 
-        def define_output_hvac_radiator_power():
-
-            if pd.notnull(building_data.zones['hvac_radiator_type']).any():
-                for zone_name, zone_data in building_data.zones.iterrows():
-                    if pd.notnull(zone_data.at['hvac_radiator_type']):
-
-                        # Heating power (radiators do not require cooling power).
-                        control_output_matrix[
-                            f'{zone_name}_radiator_thermal_power',
-                            f'{zone_name}_radiator_thermal_power'
-                        ] = 1.0
-                        control_output_matrix[
-                            'thermal_power_heating_balance',
-                            f'{zone_name}_radiator_thermal_power'
-                        ] = (
-                            1.0
-                            / zone_data.at['radiator_heating_efficiency']
-                            * zone_data.at['zone_area']
-                            / self.zone_area_total
-                        )
-
         def define_output_hvac_ahu_power():
 
-            for zone_name, zone_data in building_data.zones.iterrows():
-                if pd.notnull(zone_data.at['hvac_ahu_type']):
+            for zone_name, zone_data in (
+                    building_data.zones[
+                        pd.notnull(building_data.zones['hvac_ahu_type'])
+                    ].iterrows()
+            ):
+
+                # Obtain parameters.
+                ahu_supply_air_absolute_humidity_setpoint = (
+                    cobmo.utils.calculate_absolute_humidity_humid_air(
+                        zone_data.at['ahu_supply_air_temperature_setpoint'],
+                        zone_data.at['ahu_supply_air_relative_humidity_setpoint']
+                    )
+                )
+                delta_enthalpy_ahu_recovery = (
+                    cobmo.utils.calculate_enthalpy_humid_air(
+                        building_data.scenarios.at['linearization_zone_air_temperature'],
+                        building_data.scenarios.at['linearization_zone_air_absolute_humidity']
+                    )
+                    - cobmo.utils.calculate_enthalpy_humid_air(
+                        building_data.scenarios.at['linearization_ambient_air_temperature'],
+                        building_data.scenarios.at['linearization_zone_air_absolute_humidity']
+                    )
+                )
 
-                    # Obtain parameters.
-                    ahu_supply_air_absolute_humidity_setpoint = (
-                        cobmo.utils.calculate_absolute_humidity_humid_air(
+                # Obtain enthalpies.
+                if (
+                    building_data.scenarios.at['linearization_ambient_air_absolute_humidity']
+                    <= ahu_supply_air_absolute_humidity_setpoint
+                ):
+                    delta_enthalpy_ahu_cooling = min(
+                        0.0,
+                        cobmo.utils.calculate_enthalpy_humid_air(
                             zone_data.at['ahu_supply_air_temperature_setpoint'],
-                            zone_data.at['ahu_supply_air_relative_humidity_setpoint']
+                            building_data.scenarios.at['linearization_ambient_air_absolute_humidity']
+                        )
+                        - cobmo.utils.calculate_enthalpy_humid_air(
+                            building_data.scenarios.at['linearization_ambient_air_temperature'],
+                            building_data.scenarios.at['linearization_ambient_air_absolute_humidity']
                         )
                     )
-                    delta_enthalpy_ahu_recovery = (
+                    delta_enthalpy_ahu_heating = max(
+                        0.0,
                         cobmo.utils.calculate_enthalpy_humid_air(
-                            building_data.scenarios.at['linearization_zone_air_temperature'],
-                            building_data.scenarios.at['linearization_zone_air_absolute_humidity']
+                            zone_data.at['ahu_supply_air_temperature_setpoint'],
+                            building_data.scenarios.at['linearization_ambient_air_absolute_humidity']
                         )
                         - cobmo.utils.calculate_enthalpy_humid_air(
                             building_data.scenarios.at['linearization_ambient_air_temperature'],
-                            building_data.scenarios.at['linearization_zone_air_absolute_humidity']
+                            building_data.scenarios.at['linearization_ambient_air_absolute_humidity']
                         )
                     )
-
-                    # Obtain enthalpies.
-                    if (
-                        building_data.scenarios.at['linearization_ambient_air_absolute_humidity']
-                        <= ahu_supply_air_absolute_humidity_setpoint
-                    ):
-                        delta_enthalpy_ahu_cooling = min(
+                    delta_enthalpy_ahu_recovery_cooling = max(
+                        delta_enthalpy_ahu_cooling,
+                        min(
                             0.0,
-                            cobmo.utils.calculate_enthalpy_humid_air(
-                                zone_data.at['ahu_supply_air_temperature_setpoint'],
-                                building_data.scenarios.at['linearization_ambient_air_absolute_humidity']
-                            )
-                            - cobmo.utils.calculate_enthalpy_humid_air(
-                                building_data.scenarios.at['linearization_ambient_air_temperature'],
-                                building_data.scenarios.at['linearization_ambient_air_absolute_humidity']
-                            )
+                            zone_data.at['ahu_return_air_heat_recovery_efficiency']
+                            * delta_enthalpy_ahu_recovery
                         )
-                        delta_enthalpy_ahu_heating = max(
+                    )
+                    delta_enthalpy_ahu_recovery_heating = min(
+                        delta_enthalpy_ahu_heating,
+                        max(
                             0.0,
-                            cobmo.utils.calculate_enthalpy_humid_air(
-                                zone_data.at['ahu_supply_air_temperature_setpoint'],
-                                building_data.scenarios.at['linearization_ambient_air_absolute_humidity']
-                            )
-                            - cobmo.utils.calculate_enthalpy_humid_air(
-                                building_data.scenarios.at['linearization_ambient_air_temperature'],
-                                building_data.scenarios.at['linearization_ambient_air_absolute_humidity']
-                            )
-                        )
-                        delta_enthalpy_ahu_recovery_cooling = max(
-                            delta_enthalpy_ahu_cooling,
-                            min(
-                                0.0,
-                                zone_data.at['ahu_return_air_heat_recovery_efficiency']
-                                * delta_enthalpy_ahu_recovery
-                            )
+                            zone_data.at['ahu_return_air_heat_recovery_efficiency']
+                            * delta_enthalpy_ahu_recovery
                         )
-                        delta_enthalpy_ahu_recovery_heating = min(
-                            delta_enthalpy_ahu_heating,
-                            max(
-                                0.0,
-                                zone_data.at['ahu_return_air_heat_recovery_efficiency']
-                                * delta_enthalpy_ahu_recovery
-                            )
-                        )
-                    else:
-                        delta_enthalpy_ahu_cooling = (
-                            cobmo.utils.calculate_dew_point_enthalpy_humid_air(
-                                zone_data.at['ahu_supply_air_temperature_setpoint'],
-                                zone_data.at['ahu_supply_air_relative_humidity_setpoint']
-                            )
-                            - cobmo.utils.calculate_enthalpy_humid_air(
-                                building_data.scenarios.at['linearization_ambient_air_temperature'],
-                                building_data.scenarios.at['linearization_ambient_air_absolute_humidity']
-                            )
+                    )
+                else:
+                    delta_enthalpy_ahu_cooling = (
+                        cobmo.utils.calculate_dew_point_enthalpy_humid_air(
+                            zone_data.at['ahu_supply_air_temperature_setpoint'],
+                            zone_data.at['ahu_supply_air_relative_humidity_setpoint']
                         )
-                        delta_enthalpy_ahu_heating = (
-                            cobmo.utils.calculate_enthalpy_humid_air(
-                                zone_data.at['ahu_supply_air_temperature_setpoint'],
-                                ahu_supply_air_absolute_humidity_setpoint
-                            )
-                            - cobmo.utils.calculate_dew_point_enthalpy_humid_air(
-                                zone_data.at['ahu_supply_air_temperature_setpoint'],
-                                zone_data.at['ahu_supply_air_relative_humidity_setpoint']
-                            )
+                        - cobmo.utils.calculate_enthalpy_humid_air(
+                            building_data.scenarios.at['linearization_ambient_air_temperature'],
+                            building_data.scenarios.at['linearization_ambient_air_absolute_humidity']
                         )
-                        delta_enthalpy_ahu_recovery_cooling = max(
-                            delta_enthalpy_ahu_cooling,
-                            min(
-                                0.0,
-                                zone_data.at['ahu_return_air_heat_recovery_efficiency']
-                                * delta_enthalpy_ahu_recovery
-                            )
+                    )
+                    delta_enthalpy_ahu_heating = (
+                        cobmo.utils.calculate_enthalpy_humid_air(
+                            zone_data.at['ahu_supply_air_temperature_setpoint'],
+                            ahu_supply_air_absolute_humidity_setpoint
                         )
-                        delta_enthalpy_ahu_recovery_heating = 0.0
-
-                    # Air flow.
-                    control_output_matrix[
-                        f'{zone_name}_ahu_cool_air_flow',
-                        f'{zone_name}_ahu_cool_air_flow'
-                    ] = 1.0
-                    control_output_matrix[
-                        f'{zone_name}_ahu_heat_air_flow',
-                        f'{zone_name}_ahu_heat_air_flow'
-                    ] = 1.0
-
-                    # Cooling power.
-                    control_output_matrix[
-                        'thermal_power_cooling_balance',
-                        f'{zone_name}_ahu_cool_air_flow'
-                    ] = (
-                        1.0
-                        / 1000  # l in m³.
-                        * zone_data.at['zone_area']
-                        / self.zone_area_total
-                        * building_data.parameters.at['density_air']
-                        * (
-                            abs(delta_enthalpy_ahu_cooling)
-                            - abs(delta_enthalpy_ahu_recovery_cooling)
+                        - cobmo.utils.calculate_dew_point_enthalpy_humid_air(
+                            zone_data.at['ahu_supply_air_temperature_setpoint'],
+                            zone_data.at['ahu_supply_air_relative_humidity_setpoint']
                         )
-                        / zone_data.at['ahu_cooling_efficiency']
                     )
-                    control_output_matrix[
-                        'thermal_power_cooling_balance',
-                        f'{zone_name}_ahu_heat_air_flow'
-                    ] = (
-                        1.0
-                        / 1000  # l in m³.
-                        * zone_data.at['zone_area']
-                        / self.zone_area_total
-                        * building_data.parameters.at['density_air']
-                        * (
-                            abs(delta_enthalpy_ahu_cooling)
-                            - abs(delta_enthalpy_ahu_recovery_cooling)
+                    delta_enthalpy_ahu_recovery_cooling = max(
+                        delta_enthalpy_ahu_cooling,
+                        min(
+                            0.0,
+                            zone_data.at['ahu_return_air_heat_recovery_efficiency']
+                            * delta_enthalpy_ahu_recovery
                         )
-                        / zone_data.at['ahu_cooling_efficiency']
                     )
+                    delta_enthalpy_ahu_recovery_heating = 0.0
 
-                    # Heating power.
-                    control_output_matrix[
-                        'thermal_power_heating_balance',
-                        f'{zone_name}_ahu_cool_air_flow'
-                    ] = (
-                        1.0
-                        / 1000  # l in m³.
-                        * zone_data.at['zone_area']
-                        / self.zone_area_total
-                        * building_data.parameters.at['density_air']
-                        * (
-                            abs(delta_enthalpy_ahu_heating)
-                            - abs(delta_enthalpy_ahu_recovery_heating)
-                        )
-                        / zone_data.at['ahu_heating_efficiency']
+                # Air flow.
+                control_output_matrix[
+                    f'{zone_name}_ahu_cool_air_flow',
+                    f'{zone_name}_ahu_cool_air_flow'
+                ] = 1.0
+                control_output_matrix[
+                    f'{zone_name}_ahu_heat_air_flow',
+                    f'{zone_name}_ahu_heat_air_flow'
+                ] = 1.0
+
+                # Cooling power.
+                control_output_matrix[
+                    'thermal_power_cooling_balance',
+                    f'{zone_name}_ahu_cool_air_flow'
+                ] = (
+                    1.0
+                    / 1000  # l in m³.
+                    * zone_data.at['zone_area']
+                    / self.zone_area_total
+                    * density_air
+                    * (
+                        abs(delta_enthalpy_ahu_cooling)
+                        - abs(delta_enthalpy_ahu_recovery_cooling)
                     )
-                    control_output_matrix[
-                        'thermal_power_heating_balance',
-                        f'{zone_name}_ahu_heat_air_flow'
-                    ] = (
-                        1.0
-                        / 1000  # l in m³.
-                        * zone_data.at['zone_area']
-                        / self.zone_area_total
-                        * building_data.parameters.at['density_air']
-                        * (
-                            abs(delta_enthalpy_ahu_heating)
-                            - abs(delta_enthalpy_ahu_recovery_heating)
-                        )
-                        / zone_data.at['ahu_heating_efficiency']
+                    / zone_data.at['ahu_cooling_efficiency']
+                )
+                control_output_matrix[
+                    'thermal_power_cooling_balance',
+                    f'{zone_name}_ahu_heat_air_flow'
+                ] = (
+                    1.0
+                    / 1000  # l in m³.
+                    * zone_data.at['zone_area']
+                    / self.zone_area_total
+                    * density_air
+                    * (
+                        abs(delta_enthalpy_ahu_cooling)
+                        - abs(delta_enthalpy_ahu_recovery_cooling)
                     )
+                    / zone_data.at['ahu_cooling_efficiency']
+                )
 
-                    # Fan power.
-                    control_output_matrix[
-                        'electric_power_balance',
-                        f'{zone_name}_ahu_cool_air_flow'
-                    ] = (
-                        1.0
-                        / 1000  # l in m³.
-                        * zone_data.at['zone_area']
-                        / self.zone_area_total
-                        * building_data.parameters.at['density_air']
-                        * zone_data.at['ahu_fan_efficiency']
+                # Heating power.
+                control_output_matrix[
+                    'thermal_power_heating_balance',
+                    f'{zone_name}_ahu_cool_air_flow'
+                ] = (
+                    1.0
+                    / 1000  # l in m³.
+                    * zone_data.at['zone_area']
+                    / self.zone_area_total
+                    * density_air
+                    * (
+                        abs(delta_enthalpy_ahu_heating)
+                        - abs(delta_enthalpy_ahu_recovery_heating)
                     )
-                    control_output_matrix[
-                        'electric_power_balance',
-                        f'{zone_name}_ahu_heat_air_flow'
-                    ] = (
-                        1.0
-                        / 1000  # l in m³.
-                        * zone_data.at['zone_area']
-                        / self.zone_area_total
-                        * building_data.parameters.at['density_air']
-                        * zone_data.at['ahu_fan_efficiency']
+                    / zone_data.at['ahu_heating_efficiency']
+                )
+                control_output_matrix[
+                    'thermal_power_heating_balance',
+                    f'{zone_name}_ahu_heat_air_flow'
+                ] = (
+                    1.0
+                    / 1000  # l in m³.
+                    * zone_data.at['zone_area']
+                    / self.zone_area_total
+                    * density_air
+                    * (
+                        abs(delta_enthalpy_ahu_heating)
+                        - abs(delta_enthalpy_ahu_recovery_heating)
                     )
+                    / zone_data.at['ahu_heating_efficiency']
+                )
 
-        def define_output_hvac_tu_power():
+                # Fan power.
+                control_output_matrix[
+                    'electric_power_balance',
+                    f'{zone_name}_ahu_cool_air_flow'
+                ] = (
+                    1.0
+                    / 1000  # l in m³.
+                    * zone_data.at['zone_area']
+                    / self.zone_area_total
+                    * density_air
+                    * zone_data.at['ahu_fan_efficiency']
+                )
+                control_output_matrix[
+                    'electric_power_balance',
+                    f'{zone_name}_ahu_heat_air_flow'
+                ] = (
+                    1.0
+                    / 1000  # l in m³.
+                    * zone_data.at['zone_area']
+                    / self.zone_area_total
+                    * density_air
+                    * zone_data.at['ahu_fan_efficiency']
+                )
 
-            for zone_name, zone_data in building_data.zones.iterrows():
-                if pd.notnull(zone_data.at['hvac_tu_type']):
-                    # Calculate enthalpies.
-                    if zone_data.at['tu_air_intake_type'] == 'zone':
-                        delta_enthalpy_tu_cooling = building_data.parameters.at['heat_capacity_air'] * (
-                            building_data.scenarios.at['linearization_zone_air_temperature_cool']
-                            - zone_data.at['tu_supply_air_temperature_setpoint']
-                        )
-                        delta_enthalpy_tu_heating = building_data.parameters.at['heat_capacity_air'] * (
-                            building_data.scenarios.at['linearization_zone_air_temperature_heat']
-                            - zone_data.at['tu_supply_air_temperature_setpoint']
-                        )
-                    elif zone_data.at['tu_air_intake_type'] == 'ahu':
-                        delta_enthalpy_tu_cooling = building_data.parameters.at['heat_capacity_air'] * (
-                            building_data.scenarios.at['ahu_supply_air_temperature_setpoint']
-                            - zone_data.at['tu_supply_air_temperature_setpoint']
-                        )
-                        delta_enthalpy_tu_heating = building_data.parameters.at['heat_capacity_air'] * (
-                            building_data.scenarios.at['ahu_supply_air_temperature_setpoint']
-                            - zone_data.at['tu_supply_air_temperature_setpoint']
-                        )
-                    else:
-                        logger.error(f"Unknown `tu_air_intake_type` type: {zone_data.at['tu_air_intake_type']}")
-                        raise ValueError
-
-                    # Air flow.
-                    control_output_matrix[
-                        f'{zone_name}_tu_cool_air_flow',
-                        f'{zone_name}_tu_cool_air_flow'
-                    ] = 1.0
-                    control_output_matrix[
-                        f'{zone_name}_tu_heat_air_flow',
-                        f'{zone_name}_tu_heat_air_flow'
-                    ] = 1.0
+        def define_output_hvac_tu_power():
 
-                    # Cooling power.
-                    control_output_matrix[
-                        'thermal_power_cooling_balance',
-                        f'{zone_name}_tu_cool_air_flow'
-                    ] = (
-                        1.0
-                        / 1000  # l in m³.
-                        * zone_data.at['zone_area']
-                        / self.zone_area_total
-                        * building_data.parameters.at['density_air']
-                        * abs(delta_enthalpy_tu_cooling)
-                        / zone_data.at['tu_cooling_efficiency']
+            for zone_name, zone_data in (
+                    building_data.zones[
+                        pd.notnull(building_data.zones['hvac_tu_type'])
+                    ].iterrows()
+            ):
+                # Calculate enthalpies.
+                if zone_data.at['tu_air_intake_type'] == 'zone':
+                    delta_enthalpy_tu_cooling = heat_capacity_air * (
+                        building_data.scenarios.at['linearization_zone_air_temperature_cool']
+                        - zone_data.at['tu_supply_air_temperature_setpoint']
                     )
-
-                    # Heating power.
-                    control_output_matrix[
-                        'thermal_power_heating_balance',
-                        f'{zone_name}_tu_heat_air_flow'
-                    ] = (
-                        1.0
-                        / 1000  # l in m³.
-                        * zone_data.at['zone_area']
-                        / self.zone_area_total
-                        * building_data.parameters.at['density_air']
-                        * abs(delta_enthalpy_tu_heating)
-                        / zone_data.at['tu_heating_efficiency']
+                    delta_enthalpy_tu_heating = heat_capacity_air * (
+                        building_data.scenarios.at['linearization_zone_air_temperature_heat']
+                        - zone_data.at['tu_supply_air_temperature_setpoint']
                     )
-
-                    # Fan power.
-                    control_output_matrix[
-                        'electric_power_balance',
-                        f'{zone_name}_tu_cool_air_flow'
-                    ] = (
-                        1.0
-                        / 1000  # l in m³.
-                        * zone_data.at['zone_area']
-                        / self.zone_area_total
-                        * building_data.parameters.at['density_air']
-                        * zone_data.at['tu_fan_efficiency']
+                elif zone_data.at['tu_air_intake_type'] == 'ahu':
+                    delta_enthalpy_tu_cooling = heat_capacity_air * (
+                        building_data.scenarios.at['ahu_supply_air_temperature_setpoint']
+                        - zone_data.at['tu_supply_air_temperature_setpoint']
                     )
-                    control_output_matrix[
-                        'electric_power_balance',
-                        f'{zone_name}_tu_heat_air_flow'
-                    ] = (
-                        1.0
-                        / 1000  # l in m³.
-                        * zone_data.at['zone_area']
-                        / self.zone_area_total
-                        * building_data.parameters.at['density_air']
-                        * zone_data.at['tu_fan_efficiency']
+                    delta_enthalpy_tu_heating = heat_capacity_air * (
+                        building_data.scenarios.at['ahu_supply_air_temperature_setpoint']
+                        - zone_data.at['tu_supply_air_temperature_setpoint']
                     )
+                else:
+                    logger.error(f"Unknown `tu_air_intake_type` type: {zone_data.at['tu_air_intake_type']}")
+                    raise ValueError
+
+                # Air flow.
+                control_output_matrix[
+                    f'{zone_name}_tu_cool_air_flow',
+                    f'{zone_name}_tu_cool_air_flow'
+                ] = 1.0
+                control_output_matrix[
+                    f'{zone_name}_tu_heat_air_flow',
+                    f'{zone_name}_tu_heat_air_flow'
+                ] = 1.0
+
+                # Cooling power.
+                control_output_matrix[
+                    'thermal_power_cooling_balance',
+                    f'{zone_name}_tu_cool_air_flow'
+                ] = (
+                    1.0
+                    / 1000  # l in m³.
+                    * zone_data.at['zone_area']
+                    / self.zone_area_total
+                    * density_air
+                    * abs(delta_enthalpy_tu_cooling)
+                    / zone_data.at['tu_cooling_efficiency']
+                )
+
+                # Heating power.
+                control_output_matrix[
+                    'thermal_power_heating_balance',
+                    f'{zone_name}_tu_heat_air_flow'
+                ] = (
+                    1.0
+                    / 1000  # l in m³.
+                    * zone_data.at['zone_area']
+                    / self.zone_area_total
+                    * density_air
+                    * abs(delta_enthalpy_tu_heating)
+                    / zone_data.at['tu_heating_efficiency']
+                )
+
+                # Fan power.
+                control_output_matrix[
+                    'electric_power_balance',
+                    f'{zone_name}_tu_cool_air_flow'
+                ] = (
+                    1.0
+                    / 1000  # l in m³.
+                    * zone_data.at['zone_area']
+                    / self.zone_area_total
+                    * density_air
+                    * zone_data.at['tu_fan_efficiency']
+                )
+                control_output_matrix[
+                    'electric_power_balance',
+                    f'{zone_name}_tu_heat_air_flow'
+                ] = (
+                    1.0
+                    / 1000  # l in m³.
+                    * zone_data.at['zone_area']
+                    / self.zone_area_total
+                    * density_air
+                    * zone_data.at['tu_fan_efficiency']
+                )
 
         def define_output_hvac_vent_power():
 
-            for zone_name, zone_data in building_data.zones.iterrows():
-                if pd.notnull(zone_data.at['hvac_vent_type']):
+            for zone_name, zone_data in (
+                    building_data.zones[
+                        pd.notnull(building_data.zones['hvac_vent_type'])
+                    ].iterrows()
+            ):
 
-                    # Air flow.
-                    control_output_matrix[
-                        f'{zone_name}_vent_air_flow',
-                        f'{zone_name}_vent_air_flow'
-                    ] = 1.0
+                # Air flow.
+                control_output_matrix[
+                    f'{zone_name}_vent_air_flow',
+                    f'{zone_name}_vent_air_flow'
+                ] = 1.0
 
-                    # Fan power.
-                    control_output_matrix[
-                        'electric_power_balance',
-                        f'{zone_name}_vent_air_flow'
-                    ] = (
-                        1.0
-                        / 1000  # l in m³.
-                        * zone_data.at['zone_area']
-                        / self.zone_area_total
-                        * building_data.parameters.at['density_air']
-                        * zone_data.at['vent_fan_efficiency']
-                    )
+                # Fan power.
+                control_output_matrix[
+                    'electric_power_balance',
+                    f'{zone_name}_vent_air_flow'
+                ] = (
+                    1.0
+                    / 1000  # l in m³.
+                    * zone_data.at['zone_area']
+                    / self.zone_area_total
+                    * density_air
+                    * zone_data.at['vent_fan_efficiency']
+                )
 
         def define_output_fresh_air_flow():
 
@@ -3344,7 +3409,7 @@ class BuildingModel(object):
                                 - (
                                     1.0
                                     + (
-                                        building_data.parameters.at['heat_transfer_coefficient_interior_convection']
+                                        heat_transfer_coefficient_interior_convection
                                     )
                                     / (
                                         2.0
@@ -3361,7 +3426,7 @@ class BuildingModel(object):
                         * (
                             1.0
                             / (
-                                building_data.parameters.at['heat_transfer_coefficient_interior_convection']
+                                heat_transfer_coefficient_interior_convection
                             )
                             + 1.0
                             / (
@@ -3379,7 +3444,7 @@ class BuildingModel(object):
                         * (
                             1.0
                             / (
-                                building_data.parameters.at['heat_transfer_coefficient_interior_convection']
+                                heat_transfer_coefficient_interior_convection
                             )
                             + 1.0
                             / (
@@ -3399,13 +3464,13 @@ class BuildingModel(object):
                         * (
                             1.0
                             + (
-                                building_data.parameters.at['heat_transfer_coefficient_exterior_convection']
+                                heat_transfer_coefficient_exterior_convection
                                 + surface_data.at['heat_transfer_coefficient_surface_ground']
                                 + surface_data.at['heat_transfer_coefficient_surface_sky']
                             )
-                            / building_data.parameters.at['heat_transfer_coefficient_interior_convection']
+                            / heat_transfer_coefficient_interior_convection
                             + (
-                                building_data.parameters.at['heat_transfer_coefficient_exterior_convection']
+                                heat_transfer_coefficient_exterior_convection
                                 + surface_data.at['heat_transfer_coefficient_surface_ground']
                                 + surface_data.at['heat_transfer_coefficient_surface_sky']
                             )
@@ -3417,20 +3482,20 @@ class BuildingModel(object):
                         'ambient_air_temperature'
                     ] += (
                         (
-                            building_data.parameters.at['heat_transfer_coefficient_exterior_convection']
+                            heat_transfer_coefficient_exterior_convection
                             + surface_data.at['heat_transfer_coefficient_surface_ground']
                         )
                         * (1 - surface_data.at['window_wall_ratio'])
                         * (
                             1.0
                             + (
-                                building_data.parameters.at['heat_transfer_coefficient_exterior_convection']
+                                heat_transfer_coefficient_exterior_convection
                                 + surface_data.at['heat_transfer_coefficient_surface_ground']
                                 + surface_data.at['heat_transfer_coefficient_surface_sky']
                             )
-                            / building_data.parameters.at['heat_transfer_coefficient_interior_convection']
+                            / heat_transfer_coefficient_interior_convection
                             + (
-                                building_data.parameters.at['heat_transfer_coefficient_exterior_convection']
+                                heat_transfer_coefficient_exterior_convection
                                 + surface_data.at['heat_transfer_coefficient_surface_ground']
                                 + surface_data.at['heat_transfer_coefficient_surface_sky']
                             )
@@ -3446,13 +3511,13 @@ class BuildingModel(object):
                         * (
                             1.0
                             + (
-                                building_data.parameters.at['heat_transfer_coefficient_exterior_convection']
+                                heat_transfer_coefficient_exterior_convection
                                 + surface_data.at['heat_transfer_coefficient_surface_ground']
                                 + surface_data.at['heat_transfer_coefficient_surface_sky']
                             )
-                            / building_data.parameters.at['heat_transfer_coefficient_interior_convection']
+                            / heat_transfer_coefficient_interior_convection
                             + (
-                                building_data.parameters.at['heat_transfer_coefficient_exterior_convection']
+                                heat_transfer_coefficient_exterior_convection
                                 + surface_data.at['heat_transfer_coefficient_surface_ground']
                                 + surface_data.at['heat_transfer_coefficient_surface_sky']
                             )
@@ -3468,12 +3533,12 @@ class BuildingModel(object):
                         * (
                             1.0
                             / (
-                                building_data.parameters.at['heat_transfer_coefficient_exterior_convection']
+                                heat_transfer_coefficient_exterior_convection
                                 + surface_data.at['heat_transfer_coefficient_surface_ground']
                                 + surface_data.at['heat_transfer_coefficient_surface_sky']
                             )
                             + 1.0
-                            / building_data.parameters.at['heat_transfer_coefficient_interior_convection']
+                            / heat_transfer_coefficient_interior_convection
                             + 1.0
                             / (surface_data.at['heat_transfer_coefficient_conduction_surface'])
                         ) ** (- 1)
@@ -3496,13 +3561,13 @@ class BuildingModel(object):
                             * (1.0 - (
                                 1.0
                                 + (
-                                    building_data.parameters.at['heat_transfer_coefficient_exterior_convection']
+                                    heat_transfer_coefficient_exterior_convection
                                     + surface_data.at['heat_transfer_coefficient_surface_ground']
                                     + surface_data.at['heat_transfer_coefficient_surface_sky']
                                 )
-                                / building_data.parameters.at['heat_transfer_coefficient_interior_convection']
+                                / heat_transfer_coefficient_interior_convection
                                 + (
-                                    building_data.parameters.at['heat_transfer_coefficient_exterior_convection']
+                                    heat_transfer_coefficient_exterior_convection
                                     + surface_data.at['heat_transfer_coefficient_surface_ground']
                                     + surface_data.at['heat_transfer_coefficient_surface_sky']
                                 )
@@ -3594,23 +3659,26 @@ class BuildingModel(object):
                 )
                 & (building_data.zones['humidity_control_type'] == 'humidity_based')
             )
+            outputs_power_index = self.outputs.str.contains('_power')
+            outputs_flow_index = self.outputs.str.contains('_flow')
+            outputs_balance_index = self.outputs.str.contains('_balance')
 
             # Minimum constraint for power outputs.
             self.output_minimum_timeseries.loc[
-                :, self.outputs.str.contains('_power')
+                :, outputs_power_index
             ] = 0.0
 
             # Minimum constraint for flow outputs.
             self.output_minimum_timeseries.loc[
-                :, self.outputs.str.contains('_flow')
+                :, outputs_flow_index
             ] = 0.0
 
             # Minimum / maximum constraint for balance outputs.
             self.output_minimum_timeseries.loc[
-                :, self.outputs.str.contains('_balance')
+                :, outputs_balance_index
             ] = 0.0
             self.output_maximum_timeseries.loc[
-                :, self.outputs.str.contains('_balance')
+                :, outputs_balance_index
             ] = 0.0
 
             # Minimum / maximum constraint for zone air temperature.
@@ -3833,6 +3901,9 @@ class BuildingModel(object):
         # Convert to time discrete model.
         discretize_model()
 
+        # Instantiate sparse matrix cache.
+        self.sparse_matrix_cache = dict()
+
     def simulate(
             self,
             control_vector: pd.DataFrame,
@@ -3872,39 +3943,78 @@ class BuildingModel(object):
         if disturbance_timeseries is None:
             disturbance_timeseries = self.disturbance_timeseries
 
-        # Initialize state and output timeseries.
+        # Obtain underlying numpy arrays.
+        # - These are obtained once before the iteration, to avoid the dataframe attribute access at each timestep.
+        state_matrix = self.state_matrix.values
+        control_matrix = self.control_matrix.values
+        disturbance_matrix = self.disturbance_matrix.values
+        control_values = control_vector.values
+        disturbance_values = disturbance_timeseries.values
+
+        # Obtain control / disturbance terms of the state equation for all timesteps at once.
+        # - These terms do not depend on the state vector, such that only the state term remains in the iteration.
+        input_values = (
+            control_values[:-1, :] @ np.transpose(control_matrix)
+            + disturbance_values[:-1, :] @ np.transpose(disturbance_matrix)
+        )
+
+        # Initialize state values.
+        # - The state values are allocated without initialization, because all rows are set in the iteration below.
+        state_values = np.empty((len(self.timesteps), len(self.states)))
+        state_values[0, :] = state_vector_initial.reindex(self.states).values
+
+        # Iterative solution of the state equation.
+        # - The following equations directly use the underlying numpy arrays for faster evaluation.
+        for timestep in range(len(self.timesteps) - 1):
+            state_values[timestep + 1, :] = (
+                state_matrix @ state_values[timestep, :]
+                + input_values[timestep, :]
+            )
+
+        # Obtain state timeseries.
         state_vector = pd.DataFrame(
-            np.nan,
+            state_values,
             self.timesteps,
             self.states
         )
-        state_vector.loc[self.timesteps[0], :] = state_vector_initial
+
+        # Solution of the output equation for all timesteps at once.
+        # - The output matrices are typically very sparse, hence the cached sparse matrices are used.
         output_vector = pd.DataFrame(
-            np.nan,
+            np.transpose(
+                self.get_sparse_matrix('state_output_matrix') @ np.transpose(state_values)
+                + self.get_sparse_matrix('control_output_matrix') @ np.transpose(control_values)
+                + self.get_sparse_matrix('disturbance_output_matrix') @ np.transpose(disturbance_values)
+            ),
             self.timesteps,
             self.outputs
         )
 
-        # Iterative solution of the state space equations.
-        # - The following equations directly use the underlying numpy arrays for faster evaluation.
-        for timestep in range(len(self.timesteps) - 1):
-            state_vector.values[timestep + 1, :] = (
-                self.state_matrix.values @ state_vector.values[timestep, :]
-                + self.control_matrix.values @ control_vector.values[timestep, :]
-                + self.disturbance_matrix.values @ disturbance_timeseries.values[timestep, :]
-            )
-        for timestep in range(len(self.timesteps)):
-            output_vector.values[timestep, :] = (
-                self.state_output_matrix.values @ state_vector.values[timestep, :]
-                + self.control_output_matrix.values @ control_vector.values[timestep, :]
-                + self.disturbance_output_matrix.values @ disturbance_timeseries.values[timestep, :]
-            )
-
         return (
             state_vector,
             output_vector
         )
 
+    def get_sparse_matrix(
+            self,
+            matrix_name: str
+    ) -> scipy.sparse.csr_matrix:
+        """Obtain Scipy sparse CSR representation of the model matrix with given name, e.g. `state_output_matrix`.
+
+        - The sparse matrix is cached, such that it is obtained only once when defining multiple optimization problems
+          for the same building model, e.g. for sensitivity studies.
+        - The cache entry is renewed if the matrix attribute has been reassigned since. Note that inplace modifications
+          of the matrix dataframe are not detected.
+        """
+
+        matrix = getattr(self, matrix_name)
+
+        # Obtain sparse matrix, if not yet cached for the current matrix dataframe.
+        if (matrix_name not in self.sparse_matrix_cache) or (self.sparse_matrix_cache[matrix_name][0] is not matrix):
+            self.sparse_matrix_cache[matrix_name] = (matrix, scipy.sparse.csr_matrix(matrix.values))
+
+        return self.sparse_matrix_cache[matrix_name][1]
+
     def define_optimization_variables(
             self,
             optimization_problem: cobmo.utils.OptimizationProblem,
@@ -3941,44 +4051,53 @@ class BuildingModel(object):
             )
 
         # State equation.
+        # - Expressed in row vector form, i.e. `x[t + 1] = x[t] @ A.T + u[t] @ B.T + w[t] @ E.T`, such that the
+        #   CVXPY expressions do not need to be transposed.
+        # - The disturbance term does not depend on any variables and is therefore evaluated with numpy beforehand.
         optimization_problem.constraints.append(
             optimization_problem.state_vector[1:, :]
             ==
-            cp.transpose(
-                self.state_matrix.values
-                @ cp.transpose(optimization_problem.state_vector[:-1, :])
-                + self.control_matrix.values
-                @ cp.transpose(optimization_problem.control_vector[:-1, :])
-                + self.disturbance_matrix.values
-                @ np.transpose(self.disturbance_timeseries.iloc[:-1, :].values)
-            )
+            optimization_problem.state_vector[:-1, :]
+            @ np.transpose(self.state_matrix.values)
+            + optimization_problem.control_vector[:-1, :]
+            @ np.transpose(self.control_matrix.values)
+            + self.disturbance_timeseries.values[:-1, :]
+            @ np.transpose(self.disturbance_matrix.values)
         )
 
         # Output equation.
+        # - The output matrices are typically very sparse, hence the cached sparse matrices are used. This does not
+        #   apply to the state equation, because the matrices of the time discrete model are mostly dense.
         optimization_problem.constraints.append(
             optimization_problem.output_vector
             ==
-            cp.transpose(
-                self.state_output_matrix.values
-                @ cp.transpose(optimization_problem.state_vector)
-                + self.control_output_matrix.values
-                @ cp.transpose(optimization_problem.control_vector)
-                + self.disturbance_output_matrix.values
+            optimization_problem.state_vector
+            @ self.get_sparse_matrix('state_output_matrix').transpose()
+            + optimization_problem.control_vector
+            @ self.get_sparse_matrix('control_output_matrix').transpose()
+            + np.transpose(
+                self.get_sparse_matrix('disturbance_output_matrix')
                 @ np.transpose(self.disturbance_timeseries.values)
             )
         )
 
         # Output limits.
-        optimization_problem.constraints.append(
-            optimization_problem.output_vector
-            >=
-            self.output_minimum_timeseries.values
-        )
-        optimization_problem.constraints.append(
-            optimization_problem.output_vector
-            <=
-            self.output_maximum_timeseries.values
-        )
+        # - Limits are only defined where the limit values are finite, because infinite limits do not constrain the
+        #   problem but would still be passed to the solver as constraint rows.
+        output_minimum_index = np.isfinite(self.output_minimum_timeseries.values)
+        output_maximum_index = np.isfinite(self.output_maximum_timeseries.values)
+        if output_minimum_index.any():
+            optimization_problem.constraints.append(
+                optimization_problem.output_vector[output_minimum_index]
+                >=
+                self.output_minimum_timeseries.values[output_minimum_index]
+            )
+        if output_maximum_index.any():
+            optimization_problem.constraints.append(
+                optimization_problem.output_vector[output_maximum_index]
+                <=
+                self.output_maximum_timeseries.values[output_maximum_index]
+            )
 
     def define_optimization_objective(
             self,
@@ -3988,12 +4107,26 @@ class BuildingModel(object):
         # Obtain timestep interval in hours, for conversion of power to energy.
         timestep_interval_hours = (self.timesteps[1] - self.timesteps[0]) / pd.Timedelta('1h')
 
+        # Define electricity price parameter.
+        # - Defined as CVXPY parameter, such that the price values can be modified and the problem can be solved again
+        #   with `optimization_problem.solve(keep_problem=True)`, which reuses the existing CVXPY problem rather than
+        #   reconstructing it, e.g. for price sensitivity studies.
+        optimization_problem.electricity_price = (
+            cp.Parameter(len(self.timesteps), value=self.electricity_price_timeseries['price'].values)
+        )
+
+        # Obtain operation cost scaling factor.
+        # - The scaling factors are combined beforehand, such that the operation cost is obtained as a single inner
+        #   product in CVXPY.
+        operation_cost_factor = (
+            self.zone_area_total  # W/m² in W.
+            * timestep_interval_hours / 1000.0  # W in kWh.
+        )
+
         # Define operation cost (OPEX).
         optimization_problem.operation_cost = (
             optimization_problem.output_vector[:, self.outputs.get_loc('grid_electric_power')]
-            * self.zone_area_total  # W/m² in W.
-            * timestep_interval_hours / 1000.0  # W in kWh.
-            @ self.electricity_price_timeseries['price'].values
+            @ (operation_cost_factor * optimization_problem.electricity_price)
         )
 
         # Add to objective.
@@ -390,9 +390,10 @@ class BuildingData(object):
             # Obtain complete schedule for all weekdays.
             # TODO: Check if '01T00:00' is defined for each schedule.
             internal_gain_schedule_complete = []
+            internal_gain_schedule_days = set(internal_gain_schedule.index.day)
             for internal_gain_type in internal_gain_schedule['internal_gain_type'].unique():
                 for day in range(1, 8):
-                    if day in internal_gain_schedule.index.day.unique():
+                    if day in internal_gain_schedule_days:
                         internal_gain_schedule_complete.append(
                             internal_gain_schedule.loc[(
                                 (internal_gain_schedule.index.day == day)
@@ -535,9 +536,10 @@ class BuildingData(object):
             # Obtain complete schedule for all weekdays.
             # TODO: Check if '01T00:00' is defined for each schedule.
             constraint_schedule_complete = []
+            constraint_schedule_days = set(constraint_schedule.index.day)
             for constraint_type in constraint_schedule['constraint_type'].unique():
                 for day in range(1, 8):
-                    if day in constraint_schedule.index.day.unique():
+                    if day in constraint_schedule_days:
                         constraint_schedule_complete.append(
                             constraint_schedule.loc[(
                                 (constraint_schedule.index.day == day)
@@ -56,6 +56,11 @@ class OptimizationProblem(object):
                 else None
             ),
             verbose=cobmo.config.config['optimization']['show_solver_output'],
+            canon_backend=(
+                cobmo.config.config['optimization']['canon_backend'].upper()
+                if cobmo.config.config['optimization']['canon_backend'] is not None
+                else None
+            ),
             **cobmo.config.solver_parameters
         )
 
@@ -91,6 +96,8 @@ class MatrixConstructor(object):
     Attributes:
         index (pd.Index): Index (row) key set.
         columns (pd.Index): Columns key set.
+        index_locations (dict): Integer locations of the index (row) keys.
+        columns_locations (dict): Integer locations of the columns keys.
         data_index (list): List of data entry row locations as integer index.
         data_columns (list): List of data entry column locations as integer index.
         data_values (list): List of data entry values.
@@ -98,6 +105,8 @@ class MatrixConstructor(object):
 
     index: pd.Index
     columns: pd.Index
+    index_locations: dict
+    columns_locations: dict
     data_index: list
     data_columns: list
     data_values: list
@@ -110,6 +119,9 @@ class MatrixConstructor(object):
 
         self.index = index
         self.columns = columns
+        # Obtain integer key locations once as dictionaries, which are faster to query than the index sets.
+        self.index_locations = {key: location for location, key in enumerate(self.index)}
+        self.columns_locations = {key: location for location, key in enumerate(self.columns)}
         self.data_index = list()
         self.data_columns = list()
         self.data_values = list()
@@ -134,11 +146,11 @@ class MatrixConstructor(object):
             raise ValueError(f"Cannot use key with {len(key)} items. Only key with 2 items is valid.")
 
         # Append new values.
-        # - Integer key locations are obtained from index sets.
+        # - Integer key locations are obtained from the precomputed location dictionaries.
         # - Note that existing values are not overwritten but added up.
         # - True value setting is not available for performance reasons.
-        self.data_index.append(self.index.get_loc(key[0]))
-        self.data_columns.append(self.columns.get_loc(key[1]))
+        self.data_index.append(self.index_locations[key[0]])
+        self.data_columns.append(self.columns_locations[key[1]])
         self.data_values.append(value)
 
     def to_scipy_csr(self) -> scipy.sparse.csr_matrix:
@@ -196,13 +208,14 @@ def log_time(
             ``utils.logger``.
     """
 
-    time_now = time.time()
+    time_now = time.perf_counter()
 
+    # Messages are passed as format string with arguments, such that formatting is skipped if debug level is inactive.
     if label in log_times.keys():
-        logger_object.debug(f"Completed {label} in {(time_now - log_times[label]):.6f} seconds.")
+        logger_object.debug("Completed %s in %.6f seconds.", label, time_now - log_times[label])
     else:
         log_times[label] = time_now
-        logger_object.debug(f"Starting {label}.")
+        logger_object.debug("Starting %s.", label)
 
 
 def calculate_absolute_humidity_humid_air(
@@ -434,32 +447,23 @@ def calculate_error(
     - Note: This function doesn't check if the data format is valid.
     """
 
-    # Instantiate error timeseries / summary dataframes.
-    error_timeseries = pd.DataFrame(
-        0.0,
-        index=expected_timeseries.index,
-        columns=expected_timeseries.columns
-    )
+    # Calculate error timeseries.
+    # - Obtained for all timesteps at once, with the predicted values aligned to the expected index / columns.
+    error_timeseries = (
+        predicted_timeseries.loc[expected_timeseries.index, expected_timeseries.columns]
+        - expected_timeseries
+    ).astype(float)
+
+    # Calculate error summary.
     error_summary = pd.DataFrame(
-        0.0,
+        [
+            error_timeseries.abs().mean(),
+            (error_timeseries ** 2).mean() ** 0.5
+        ],
         index=pd.Index(['mean_absolute_error', 'root_mean_squared_error'], name='error_type'),
         columns=expected_timeseries.columns
     )
 
-    # Calculate error values.
-    for index, row in error_timeseries.iterrows():
-        error_timeseries.loc[index, :] = (
-            predicted_timeseries.loc[index, :]
-            - expected_timeseries.loc[index, :]
-        )
-    for column_name, column in error_summary.iteritems():
-        error_summary.loc['mean_absolute_error', column_name] = (
-            error_timeseries[column_name].abs().mean()
-        )
-        error_summary.loc['root_mean_squared_error', column_name] = (
-            (error_timeseries[column_name] ** 2).mean() ** 0.5
-        )
-
     return (
         error_summary,
         error_timeseries
@@ -507,19 +511,16 @@ def calculate_discounted_payback_time(
             simple_payback_time = None
 
         # Calculate discounted payback time in years.
-        year = 0
-        annual_discounted_savings = np.zeros(int(np.ceil(lifetime)) + 1)
-        cumulative_discounted_savings = np.zeros(int(np.ceil(lifetime)) + 1)
-        while cumulative_discounted_savings[year] < investment_cost:
-            year += 1
-            discount_factor = (1.0 + interest_rate) ** (-year)
-            annual_discounted_savings[year] = operation_cost_savings_annual * discount_factor
-            cumulative_discounted_savings[year] = cumulative_discounted_savings[year - 1] + annual_discounted_savings[year]
-
-            # Discontinue calculations if payback is not reached within lifetime, return None.
-            if year >= lifetime:
-                year = None
-        discounted_payback_time = year
+        # - The cumulative discounted savings are obtained for all years of the lifetime at once.
+        years = np.arange(int(np.ceil(lifetime)) + 1)
+        annual_discounted_savings = operation_cost_savings_annual * (1.0 + interest_rate) ** (- years)
+        annual_discounted_savings[0] = 0.0
+        cumulative_discounted_savings = np.cumsum(annual_discounted_savings)
+
+        # Obtain first year in which the investment cost is recovered.
+        # - If payback is not reached within lifetime, return None.
+        payback_years = years[(cumulative_discounted_savings >= investment_cost) & (years < lifetime)]
+        discounted_payback_time = int(payback_years[0]) if len(payback_years) > 0 else None
 
     return (
         simple_payback_time,
@@ -13,7 +13,7 @@ setuptools.setup(
     py_modules=setuptools.find_packages(),
     install_requires=[
         # Please note: Dependencies must also be added in `docs/conf.py` to `autodoc_mock_imports`.
-        'cvxpy',
+        'cvxpy>=1.3',  # For `canon_backend` keyword argument.
         'CoolProp==6.2.1',
         'hvplot',
         'kaleido',  # For static plot output with plotly.